@@ -0,0 +1,23 @@
+"""Status output shared by the example scripts."""
+
+import sys
+
+
+def eprint(message: str, *, style: str | None = None, plain: bool = False) -> None:
+    """Print a status message to stderr.
+
+    The message is printed literally, never parsed as rich markup. Plain
+    output uses the builtin print, so quiet and JSON runs skip importing rich.
+
+    Args:
+        message: Message text.
+        style: Rich style applied to the whole message, e.g. "red".
+        plain: Print without rich styling.
+    """
+    if plain:
+        print(message, file=sys.stderr)
+        return
+
+    from rich.console import Console
+
+    Console(stderr=True).print(message, style=style, markup=False, highlight=False)
@@ -12,20 +12,19 @@ from speechify_client import SpeechifyClient
 
 # Initialize the client
 # API key is automatically loaded from .env file via python-dotenv
-client = SpeechifyClient()
+# Access tokens are cached in ~/.cache/speechify so later runs can reuse them
+client = SpeechifyClient(cache_access_token=True)
 
 try:
-    # Create an access token from your API key
-    token_response = client.create_access_token()
-    print("Access token created successfully")
-    print(f"Token type: {token_response.token_type}")
-    print(f"Expires in: {token_response.expires_in} seconds")
+    # Reuse a cached access token, or create one from your API key
+    client.ensure_access_token()
+    print("Access token ready")
 
-    # The token is automatically used for subsequent requests
+    # The token is automatically used (and refreshed) for subsequent requests
     # You can verify this by checking client._access_token
 
     # Get available voices to use for synthesis
-    voices = client.list_voices()
+    voices = client.list_voices(limit=1)
     if not voices:
         print("No voices available")
         exit(1)
@@ -13,7 +13,6 @@ Note:
     Install on Ubuntu/Debian: sudo apt-get install sox
 """
 
-import base64
 import logging
 import subprocess
 from pathlib import Path
@@ -28,10 +27,10 @@ logging.basicConfig(level=logging.INFO)
 client = SpeechifyClient()
 
 try:
-    # List available voices
-    voices = client.list_voices()
-    print(f"Available voices: {len(voices)}")
-    for voice in voices[:3]:
+    # List the first few available voices
+    voices = client.list_voices(limit=3)
+    print("Sample voices:")
+    for voice in voices:
         print(f"  - {voice.name} (ID: {voice.voice_id})")
 
     # Synthesize speech from text
@@ -49,7 +48,7 @@ try:
 
         output_path = output_dir / "basic_usage_output.mp3"
         with open(output_path, "wb") as f:
-            f.write(base64.b64decode(response.audio_data))
+            f.write(response.audio_bytes)
         print(f"Audio saved to {output_path}")
 
         # Play the audio file using the 'play' command
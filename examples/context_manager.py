@@ -15,7 +15,7 @@ from speechify_client import SpeechifyClient
 # API key is automatically loaded from .env file via python-dotenv
 with SpeechifyClient() as client:
     # First, list available voices to get a valid voice_id
-    voices = client.list_voices()
+    voices = client.list_voices(limit=1)
     if not voices:
         print("No voices available")
         exit(1)
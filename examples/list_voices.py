@@ -17,9 +17,7 @@ import argparse
 import json
 import sys
 
-from rich import print
-from rich.console import Console
-from rich.table import Table
+from _console import eprint
 
 from speechify_client import SpeechifyClient, SpeechifyError
 
@@ -30,6 +28,9 @@ def display_table(voices: list) -> None:
     Args:
         voices: List of Voice objects from the API.
     """
+    from rich.console import Console
+    from rich.table import Table
+
     console = Console()
 
     table = Table(
@@ -61,6 +62,8 @@ def display_list(voices: list) -> None:
     Args:
         voices: List of Voice objects from the API.
     """
+    from rich import print
+
     print(f"[bold cyan]Available Voices ({len(voices)}):[/bold cyan]\n")
 
     for i, voice in enumerate(voices, 1):
@@ -75,14 +78,19 @@ def display_list(voices: list) -> None:
               f"[blue]{language}[/blue]")
 
 
-def display_json(voices: list) -> None:
-    """Display voices as JSON.
+def display_json(voices_data: list[dict]) -> None:
+    """Display raw voice data as JSON, using orjson when installed.
 
     Args:
-        voices: List of Voice objects from the API.
+        voices_data: List of voice dictionaries from the API.
     """
-    voices_data = [voice.to_dict() for voice in voices]
-    print(json.dumps(voices_data, indent=2))
+    try:
+        import orjson
+    except ImportError:
+        print(json.dumps(voices_data, indent=2))
+        return
+
+    sys.stdout.buffer.write(orjson.dumps(voices_data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
 
 
 def main() -> None:
@@ -103,28 +111,30 @@ def main() -> None:
         help="Limit number of voices to display",
     )
     args = parser.parse_args()
+    plain = args.format == "json"
 
     # Initialize the client
     # API key is automatically loaded from .env file via python-dotenv
     try:
         client = SpeechifyClient()
     except Exception as e:
-        print(f"[red]Error initializing client:[/red] {e}", file=sys.stderr)
+        eprint(f"Error initializing client: {e}", style="red", plain=plain)
         sys.exit(1)
 
     try:
         # Get all voices
-        print("[yellow]Fetching voices...[/yellow]", file=sys.stderr)
-        voices = client.list_voices()
+        eprint("Fetching voices...", style="yellow", plain=plain)
+        limit = args.limit if args.limit and args.limit > 0 else None
+        if args.format == "json":
+            # JSON output uses the raw API data and skips building Voice objects
+            voices = client.list_voices_raw()[:limit]
+        else:
+            voices = client.list_voices(limit=limit)
 
         if not voices:
-            print("[red]No voices available.[/red]", file=sys.stderr)
+            eprint("No voices available.", style="red", plain=plain)
             sys.exit(1)
 
-        # Apply limit if specified
-        if args.limit and args.limit > 0:
-            voices = voices[:args.limit]
-
         # Display voices in requested format
         if args.format == "table":
             display_table(voices)
@@ -134,7 +144,7 @@ def main() -> None:
             display_json(voices)
 
     except SpeechifyError as e:
-        print(f"[red]Speechify error:[/red] {e.message}", file=sys.stderr)
+        eprint(f"Speechify error: {e.message}", style="red", plain=plain)
         sys.exit(1)
     finally:
         client.close()
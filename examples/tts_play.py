@@ -1,7 +1,9 @@
 """Text-to-speech playback from stdin.
 
 Reads text from standard input, synthesizes speech using Speechify API,
-and plays the generated audio immediately.
+and plays the generated audio immediately. Input is split into sentences
+that are synthesized in the background, so playback starts after the
+first sentence instead of after the whole input.
 
 Setup:
     1. Copy .env.example to .env
@@ -23,33 +25,177 @@ Note:
 """
 
 import argparse
-import base64
+import itertools
+import queue
+import re
 import subprocess
 import sys
 import tempfile
+import threading
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
-from rich import print
+from _console import eprint
 
 from speechify_client import SpeechifyClient, SpeechifyError
 
+SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+")
+SENTENCE_ENDINGS = (".", "!", "?")
+MAX_SENTENCE_CHARS = 1000
+SYNTHESIS_WORKERS = 4
 
-def play_audio(audio_path: Path, speed: float = 1.25) -> None:
-    """Play audio file using the 'play' command.
+
+def play_audio(audio_chunks: Iterable[bytes], speed: float = 1.25) -> None:
+    """Play MP3 audio by piping it to the 'play' command's stdin.
+
+    Playback starts as soon as the first chunk arrives; nothing is
+    written to disk.
 
     Args:
-        audio_path: Path to the audio file to play.
+        audio_chunks: MP3 audio chunks to play.
+        speed: Playback tempo.
 
     Raises:
         FileNotFoundError: If 'play' command is not found.
         subprocess.CalledProcessError: If playback fails.
     """
-    subprocess.run(
-        ["play", str(audio_path), "tempo", f"{speed:.2f}"],
-        check=True,
-        capture_output=True,
-        text=True,
-    )
+    # stderr goes to a file, not a pipe: warnings written while decoding a long
+    # input would otherwise fill the pipe and block play from reading stdin
+    with tempfile.TemporaryFile() as stderr_file:
+        process = subprocess.Popen(
+            ["play", "-q", "-t", "mp3", "-", "tempo", f"{speed:.2f}"],
+            stdin=subprocess.PIPE,
+            stderr=stderr_file,
+        )
+        try:
+            for chunk in audio_chunks:
+                process.stdin.write(chunk)
+            process.stdin.close()
+        except BrokenPipeError:
+            # play exited early; its exit status and stderr explain why
+            pass
+        except BaseException:
+            process.kill()
+            process.wait()
+            raise
+
+        if process.wait() != 0:
+            stderr_file.seek(0)
+            stderr = stderr_file.read().decode(errors="replace")
+            raise subprocess.CalledProcessError(process.returncode, process.args, stderr=stderr)
+
+
+def save_chunks(audio_chunks: Iterable[bytes], path: Path) -> Iterator[bytes]:
+    """Write audio chunks to a file while passing them through.
+
+    Args:
+        audio_chunks: Audio chunks to save.
+        path: Destination file.
+
+    Yields:
+        The unchanged audio chunks.
+    """
+    with open(path, "wb") as f:
+        for chunk in audio_chunks:
+            f.write(chunk)
+            yield chunk
+
+
+def iter_sentences(lines: Iterable[str]) -> Iterator[str]:
+    """Split streamed text into sentences as soon as each one is complete.
+
+    Only newly read text is scanned. Blank lines also end a sentence, and
+    unpunctuated text is flushed at a word boundary once it reaches
+    MAX_SENTENCE_CHARS, so the buffer stays bounded.
+
+    Args:
+        lines: Lines of text, e.g. sys.stdin.
+
+    Yields:
+        Non-empty sentences, in input order.
+    """
+    buffer = ""
+    for line in lines:
+        if not line.strip():
+            if buffer.strip():
+                yield buffer.strip()
+            buffer = ""
+            continue
+
+        # A sentence ending at the end of the previous line
+        if buffer.endswith(SENTENCE_ENDINGS) and line[:1].isspace():
+            yield buffer.strip()
+            buffer = ""
+
+        *sentences, tail = SENTENCE_BOUNDARY.split(line)
+        if sentences:
+            sentences[0] = buffer + sentences[0]
+            buffer = tail
+        else:
+            buffer += tail
+        for sentence in sentences:
+            if sentence.strip():
+                yield sentence.strip()
+
+        while len(buffer) > MAX_SENTENCE_CHARS:
+            cut = max(buffer.rfind(space, 0, MAX_SENTENCE_CHARS) for space in " \t\n")
+            if cut <= 0:
+                cut = MAX_SENTENCE_CHARS
+            if buffer[:cut].strip():
+                yield buffer[:cut].strip()
+            buffer = buffer[cut:]
+    if buffer.strip():
+        yield buffer.strip()
+
+
+def synthesize_sentences(
+    client: SpeechifyClient,
+    sentences: Iterable[str],
+    *,
+    voice_id: str,
+    speed: float,
+    max_workers: int = SYNTHESIS_WORKERS,
+) -> Iterator[bytes]:
+    """Synthesize sentences in the background and yield their audio in order.
+
+    A reader thread pulls sentences and submits them to a small thread pool
+    while earlier audio is already playing; at most max_workers sentences
+    are synthesized ahead of playback.
+
+    Args:
+        client: Speechify client used for synthesis.
+        sentences: Sentences to synthesize.
+        voice_id: ID of the voice to use.
+        speed: Speech speed.
+        max_workers: Maximum concurrent synthesis requests.
+
+    Yields:
+        MP3 audio for each sentence.
+    """
+    pending: queue.Queue[Future[bytes] | None] = queue.Queue(maxsize=max_workers)
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    def synthesize(sentence: str) -> bytes:
+        return b"".join(client.synthesize_stream(text=sentence, voice_id=voice_id, speed=speed))
+
+    def submit_all() -> None:
+        try:
+            for sentence in sentences:
+                pending.put(executor.submit(synthesize, sentence))
+        except RuntimeError:
+            # The executor was shut down because playback stopped early
+            pass
+        finally:
+            pending.put(None)
+
+    reader = threading.Thread(target=submit_all, daemon=True)
+    reader.start()
+    try:
+        while (future := pending.get()) is not None:
+            yield future.result()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
 
 
 def main() -> None:
@@ -82,13 +228,15 @@ def main() -> None:
 
     # Read text from stdin
     if sys.stdin.isatty():
-        print("[red]Error:[/red] No input provided. Please pipe text to stdin.", file=sys.stderr)
-        print("[dim]Example: echo 'Hello' | uv run python examples/tts_play.py[/dim]", file=sys.stderr)
+        eprint("Error: No input provided. Please pipe text to stdin.", style="red", plain=args.quiet)
+        eprint("Example: echo 'Hello' | uv run python examples/tts_play.py", style="dim", plain=args.quiet)
         sys.exit(1)
 
-    text = sys.stdin.read().strip()
-    if not text:
-        print("[red]Error:[/red] Empty input received.", file=sys.stderr)
+    # Split stdin into sentences lazily so synthesis starts before input ends
+    sentences = iter_sentences(sys.stdin)
+    first_sentence = next(sentences, None)
+    if first_sentence is None:
+        eprint("Error: Empty input received.", style="red", plain=args.quiet)
         sys.exit(1)
 
     # Initialize the client
@@ -100,71 +248,58 @@ def main() -> None:
         if args.voice_id:
             voice_id = args.voice_id
             if not args.quiet:
-                print(f"[cyan]Using voice:[/cyan] {voice_id}", file=sys.stderr)
+                eprint(f"Using voice: {voice_id}", style="cyan", plain=args.quiet)
         else:
-            voices = client.list_voices()
+            voices = client.list_voices(limit=1)
             if not voices:
-                print("[red]Error:[/red] No voices available.", file=sys.stderr)
+                eprint("Error: No voices available.", style="red", plain=args.quiet)
                 sys.exit(1)
             voice_id = voices[0].voice_id
             if not args.quiet:
-                print(f"[cyan]Using default voice:[/cyan] [bold]{voice_id}[/bold]", file=sys.stderr)
+                eprint(f"Using default voice: {voice_id}", style="cyan", plain=args.quiet)
 
-        # Synthesize speech from text
-        if not args.quiet:
-            preview = text[:50] + "..." if len(text) > 50 else text
-            print(f"[yellow]Synthesizing:[/yellow] [italic]{preview}[/italic]", file=sys.stderr)
+        def announce(sentences: Iterable[str]) -> Iterator[str]:
+            for sentence in sentences:
+                if not args.quiet:
+                    preview = sentence[:50] + "..." if len(sentence) > 50 else sentence
+                    eprint(f"Synthesizing: {preview}", style="yellow", plain=args.quiet)
+                yield sentence
 
-        response = client.synthesize(
-            text=text,
+        # Synthesize sentence by sentence in the background while playing
+        audio_chunks = synthesize_sentences(
+            client,
+            announce(itertools.chain([first_sentence], sentences)),
             voice_id=voice_id,
             speed=args.speed,
         )
 
-        if not response.audio_data:
-            print("[red]Error:[/red] No audio data received from API.", file=sys.stderr)
-            sys.exit(1)
-
-        # Create outputs directory
-        # output_dir = Path("outputs")
-        # output_dir.mkdir(exist_ok=True)
-        output_dir = Path(tempfile.gettempdir())
-
-        # Save audio to temporary file for playback
-        output_path = output_dir / "tts_play_output.mp3"
-        with open(output_path, "wb") as f:
-            f.write(base64.b64decode(response.audio_data))
-
         if args.save:
-            if not args.quiet:
-                print(f"[green]✓[/green] Audio saved to [bold]{output_path}[/bold]", file=sys.stderr)
-        else:
-            if not args.quiet:
-                print(f"[dim]Temporary audio: {output_path}[/dim]", file=sys.stderr)
+            output_path = Path(tempfile.gettempdir()) / "tts_play_output.mp3"
+            audio_chunks = save_chunks(audio_chunks, output_path)
 
-        # Play the audio file
+        # Stream the audio straight into the player
         try:
             if not args.quiet:
-                print(f"[magenta]♪[/magenta] Playing audio (speed: {args.speed:.2f})...", file=sys.stderr)
-            play_audio(output_path, speed=args.speed)
+                eprint(f"♪ Playing audio (speed: {args.speed:.2f})...", style="magenta", plain=args.quiet)
+            play_audio(audio_chunks, speed=args.speed)
             if not args.quiet:
-                print("[green]✓[/green] Playback completed", file=sys.stderr)
+                eprint("✓ Playback completed", style="green", plain=args.quiet)
         except FileNotFoundError:
-            print(
-                "[red]Error:[/red] 'play' command not found. Install sox: [cyan]sudo apt-get install sox[/cyan]",
-                file=sys.stderr,
+            eprint(
+                "Error: 'play' command not found. Install sox: sudo apt-get install sox",
+                style="red",
+                plain=args.quiet,
             )
             sys.exit(1)
         except subprocess.CalledProcessError as e:
-            print(f"[red]Error playing audio:[/red] {e.stderr}", file=sys.stderr)
+            eprint(f"Error playing audio: {e.stderr}", style="red", plain=args.quiet)
             sys.exit(1)
-        finally:
-            # Clean up temporary file if not saving
-            if not args.save and output_path.exists():
-                output_path.unlink()
+
+        if args.save and not args.quiet:
+            eprint(f"✓ Audio saved to {output_path}", style="green", plain=args.quiet)
 
     except SpeechifyError as e:
-        print(f"[red]Speechify error:[/red] {e.message}", file=sys.stderr)
+        eprint(f"Speechify error: {e.message}", style="red", plain=args.quiet)
         sys.exit(1)
     finally:
         client.close()
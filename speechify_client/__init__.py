@@ -4,8 +4,22 @@ This module provides a simple, type-safe REST client for the Speechify AI API,
 enabling easy integration of text-to-speech capabilities into Python applications.
 """
 
-from speechify_client.client import SpeechifyClient
+from typing import TYPE_CHECKING, Any
+
+__version__ = "0.1.0"
+
 from speechify_client.exceptions import SpeechifyError
 
+if TYPE_CHECKING:
+    from speechify_client.client import SpeechifyClient
+
 __all__ = ["SpeechifyClient", "SpeechifyError"]
-__version__ = "0.1.0"
+
+
+def __getattr__(name: str) -> Any:
+    """Import SpeechifyClient on first access, so models and exceptions load without requests."""
+    if name == "SpeechifyClient":
+        from speechify_client.client import SpeechifyClient
+
+        return SpeechifyClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,31 @@
+"""JSON encoding helpers using orjson when available.
+
+orjson is an optional speedup (``pip install speechify-client[speedups]``);
+the standard library json module is used otherwise.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the speedups extra
+    orjson = None
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize obj to UTF-8 encoded JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def loads(data: bytes | str) -> Any:
+    """Deserialize JSON bytes or text.
+
+    Raises:
+        ValueError: If data is not valid JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
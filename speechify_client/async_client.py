@@ -0,0 +1,376 @@
+"""Asynchronous Speechify REST client built on httpx.
+
+Requires the optional ``async`` extra: ``pip install speechify-client[async]``.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from typing import Any
+
+import httpx
+
+from speechify_client import __version__, _json
+from speechify_client.client import (
+    API_BASE_URL,
+    DEFAULT_BATCH_WORKERS,
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_POOL_SIZE,
+    DEFAULT_TIMEOUT,
+    DEFAULT_VOICES_CACHE_TTL,
+    SCRIPT_NAME,
+    SPEECH_ENDPOINT,
+    TOKEN_ENDPOINT,
+    TOKEN_REFRESH_MARGIN,
+    VOICES_ENDPOINT,
+)
+from speechify_client.exceptions import APIError, AuthenticationError, ValidationError
+from speechify_client.models import (
+    AccessToken,
+    SpeechSynthesisRequest,
+    SpeechSynthesisResponse,
+    Voice,
+)
+
+_logger = logging.getLogger(__name__)
+
+
+class AsyncSpeechifyClient:
+    """Asynchronous REST client for Speechify AI API.
+
+    Mirrors SpeechifyClient with coroutine methods. Requests share one
+    HTTP/2 connection pool, so concurrent calls are multiplexed.
+    """
+
+    def __init__(
+        self,
+        *,
+        api_key: str | None = None,
+        timeout: int = DEFAULT_TIMEOUT,
+        voices_cache_ttl: int = DEFAULT_VOICES_CACHE_TTL,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        """Initialize asynchronous Speechify REST client.
+
+        Args:
+            api_key: Speechify API key. Defaults to SPEECHIFY_API_KEY env var.
+            timeout: Request timeout in seconds.
+            voices_cache_ttl: Seconds to reuse the result of list_voices. Use 0 to disable caching.
+            pool_size: Maximum number of pooled connections.
+            max_retries: Retries for failed connection attempts.
+            transport: Custom httpx transport, mainly for testing.
+
+        Raises:
+            ValidationError: If API key is not provided or found.
+        """
+        if api_key is None:
+            from dotenv import load_dotenv
+
+            # Load environment variables from .env file
+            load_dotenv()
+
+        self.api_key = api_key or os.getenv("SPEECHIFY_API_KEY")
+        if not self.api_key:
+            raise ValidationError(
+                message="Speechify API key not provided. Set SPEECHIFY_API_KEY "
+                "environment variable or pass api_key parameter."
+            )
+
+        self.timeout = timeout
+        self.base_url = API_BASE_URL
+        self.voices_cache_ttl = voices_cache_ttl
+        self._access_token: str | None = None
+        self._access_token_expires_at: float | None = None
+        self._token_lock = asyncio.Lock()
+        self._voices_cache: tuple[float, list[dict[str, Any]]] | None = None
+        self._client = httpx.AsyncClient(
+            base_url=API_BASE_URL,
+            timeout=timeout,
+            headers={
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": "application/json",
+                "User-Agent": f"{SCRIPT_NAME}/{__version__}",
+            },
+            transport=transport
+            or httpx.AsyncHTTPTransport(
+                http2=True,
+                retries=max_retries,
+                limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size),
+            ),
+        )
+        _logger.debug("Initialized async Speechify client")
+
+    async def _make_request(
+        self,
+        *,
+        method: str,
+        endpoint: str,
+        json_data: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> Any:
+        """Make HTTP request to Speechify API.
+
+        Args:
+            method: HTTP method (GET, POST, etc.).
+            endpoint: API endpoint path.
+            json_data: JSON body for POST/PUT requests.
+            headers: Per-request headers overriding the client defaults.
+
+        Returns:
+            Parsed JSON response.
+
+        Raises:
+            AuthenticationError: If authentication fails.
+            APIError: If API request fails.
+        """
+        if self._access_token_expires_at is not None and endpoint != TOKEN_ENDPOINT:
+            await self.ensure_access_token()
+
+        try:
+            response = await self._client.request(
+                method,
+                endpoint,
+                content=_json.dumps(json_data) if json_data is not None else None,
+                headers=headers,
+            )
+        except httpx.HTTPError as e:
+            _logger.error("Request failed: %s", e)
+            raise APIError(message=f"Request failed: {str(e)}") from e
+
+        _logger.debug("API request: %s %s - %d", method, endpoint, response.status_code)
+
+        if response.status_code == 401:
+            raise AuthenticationError(
+                message="Invalid API key or expired access token",
+                status_code=response.status_code,
+            )
+
+        if response.status_code >= 400:
+            try:
+                error_data = _json.loads(response.content)
+            except ValueError:
+                error_data = {"message": response.text}
+
+            raise APIError(
+                message=error_data.get("message", f"API error: {response.status_code}"),
+                status_code=response.status_code,
+                response_data=error_data,
+            )
+
+        try:
+            return _json.loads(response.content)
+        except ValueError as e:
+            raise APIError(message=f"Request failed: {str(e)}", status_code=response.status_code) from e
+
+    async def synthesize(
+        self,
+        *,
+        text: str,
+        voice_id: str,
+        speed: float = 1.25,
+        audio_format: str = "mp3",
+    ) -> SpeechSynthesisResponse:
+        """Synthesize speech from text.
+
+        Args:
+            text: Text to synthesize to speech.
+            voice_id: ID of the voice to use for synthesis.
+            audio_format: Audio format (mp3, wav, etc.).
+
+        Returns:
+            Speech synthesis response with audio data.
+
+        Raises:
+            ValidationError: If input parameters are invalid.
+            APIError: If synthesis request fails.
+        """
+        if not text or text.isspace():
+            raise ValidationError(message="Text input cannot be empty")
+        if not voice_id or voice_id.isspace():
+            raise ValidationError(message="Voice ID cannot be empty")
+
+        request_data = SpeechSynthesisRequest(
+            input_text=text,
+            voice_id=voice_id,
+            audio_format=audio_format,
+        )
+
+        response_data = await self._make_request(
+            method="POST",
+            endpoint=SPEECH_ENDPOINT,
+            json_data=request_data.to_dict(),
+        )
+
+        _logger.info("Synthesized speech for voice: %s", voice_id)
+        return SpeechSynthesisResponse.from_dict(response_data)
+
+    async def asynthesize_many(
+        self,
+        *,
+        texts: list[str],
+        voice_id: str,
+        speed: float = 1.25,
+        audio_format: str = "mp3",
+        max_concurrency: int = DEFAULT_BATCH_WORKERS,
+    ) -> list[SpeechSynthesisResponse]:
+        """Synthesize several texts concurrently.
+
+        Args:
+            texts: Texts to synthesize to speech.
+            voice_id: ID of the voice to use for synthesis.
+            speed: Speech speed passed to each synthesis call.
+            audio_format: Audio format (mp3, wav, etc.).
+            max_concurrency: Maximum number of in-flight requests.
+
+        Returns:
+            Speech synthesis responses in the same order as texts.
+
+        Raises:
+            ValidationError: If input parameters are invalid.
+            APIError: If any synthesis request fails.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _synthesize_one(text: str) -> SpeechSynthesisResponse:
+            async with semaphore:
+                return await self.synthesize(text=text, voice_id=voice_id, speed=speed, audio_format=audio_format)
+
+        return list(await asyncio.gather(*(_synthesize_one(text) for text in texts)))
+
+    async def list_voices(self, *, limit: int | None = None, force_refresh: bool = False) -> list[Voice]:
+        """Get list of available voices.
+
+        The API response is cached for ``voices_cache_ttl`` seconds.
+
+        Args:
+            limit: Maximum number of voices to return. Only this many Voice
+                objects are built.
+            force_refresh: Bypass the cache and fetch voices from the API.
+
+        Returns:
+            List of available voices.
+
+        Raises:
+            ValidationError: If limit is negative.
+            APIError: If request fails.
+        """
+        if limit is not None and limit < 0:
+            raise ValidationError(message="Limit cannot be negative")
+
+        voice_list = None
+        if not force_refresh and self._voices_cache is not None:
+            cached_at, cached_list = self._voices_cache
+            if time.monotonic() - cached_at < self.voices_cache_ttl:
+                _logger.debug("Using cached voice list")
+                voice_list = cached_list
+
+        if voice_list is None:
+            voice_list = await self.list_voices_raw()
+            if self.voices_cache_ttl > 0:
+                self._voices_cache = (time.monotonic(), voice_list)
+            _logger.info("Retrieved %d available voices", len(voice_list))
+
+        if limit is not None:
+            voice_list = voice_list[:limit]
+
+        from_dict = Voice.from_dict
+        return [from_dict(voice_data) for voice_data in voice_list]
+
+    async def list_voices_raw(self) -> list[dict[str, Any]]:
+        """Get available voices as the raw dictionaries returned by the API.
+
+        Results are not cached.
+
+        Returns:
+            List of voice dictionaries.
+
+        Raises:
+            APIError: If request fails.
+        """
+        response_data = await self._make_request(method="GET", endpoint=VOICES_ENDPOINT)
+
+        # Handle both list and dict responses
+        if isinstance(response_data, list):
+            return response_data
+        return response_data.get("voices", [])
+
+    def invalidate_voices_cache(self) -> None:
+        """Discard the cached voice list so the next list_voices call hits the API."""
+        self._voices_cache = None
+
+    async def get_voice(self, *, voice_id: str) -> Voice:
+        """Get details for a specific voice.
+
+        Args:
+            voice_id: ID of the voice to retrieve.
+
+        Returns:
+            Voice details.
+
+        Raises:
+            ValidationError: If voice_id is invalid.
+            APIError: If request fails.
+        """
+        if not voice_id or voice_id.isspace():
+            raise ValidationError(message="Voice ID cannot be empty")
+
+        response_data = await self._make_request(method="GET", endpoint=f"{VOICES_ENDPOINT}/{voice_id}")
+
+        _logger.info("Retrieved voice details: %s", voice_id)
+        return Voice.from_dict(response_data)
+
+    async def create_access_token(self) -> AccessToken:
+        """Create an access token from API key.
+
+        The token replaces the API key for authenticating subsequent requests
+        and is refreshed automatically shortly before it expires.
+
+        Returns:
+            Access token response.
+
+        Raises:
+            APIError: If token creation fails.
+        """
+        response_data = await self._make_request(
+            method="POST",
+            endpoint=TOKEN_ENDPOINT,
+            headers={"Authorization": f"Bearer {self.api_key}"},
+        )
+
+        token = AccessToken.from_dict(response_data)
+        self._access_token = token.access_token
+        self._access_token_expires_at = time.time() + token.expires_in
+        self._client.headers["Authorization"] = f"Bearer {token.access_token}"
+        _logger.info("Created access token")
+        return token
+
+    async def ensure_access_token(self) -> str:
+        """Get a valid access token, creating one if missing or about to expire.
+
+        Returns:
+            Current access token.
+
+        Raises:
+            APIError: If token creation fails.
+        """
+        async with self._token_lock:
+            expires_at = self._access_token_expires_at
+            if self._access_token is None or expires_at is None or time.time() >= expires_at - TOKEN_REFRESH_MARGIN:
+                await self.create_access_token()
+            return self._access_token
+
+    async def aclose(self) -> None:
+        """Close the HTTP client."""
+        await self._client.aclose()
+        _logger.debug("Closed async Speechify client")
+
+    async def __aenter__(self) -> "AsyncSpeechifyClient":
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Async context manager exit."""
+        await self.aclose()
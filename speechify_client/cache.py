@@ -0,0 +1,139 @@
+"""On-disk caches for Speechify REST client."""
+
+import hashlib
+import logging
+import os
+import tempfile
+from pathlib import Path
+
+_logger = logging.getLogger(__name__)
+
+AUDIO_CACHE_SUBDIR = "audio"
+
+
+def get_cache_dir() -> Path:
+    """Get the directory for on-disk caches.
+
+    Returns:
+        SPEECHIFY_CACHE_DIR if set, otherwise ~/.cache/speechify.
+    """
+    return Path(os.getenv("SPEECHIFY_CACHE_DIR") or Path.home() / ".cache" / "speechify")
+
+
+def atomic_write(path: Path, data: bytes) -> None:
+    """Write data to path atomically, readable only by the owner.
+
+    Args:
+        path: Destination file. Parent directories are created as needed.
+        data: Bytes to write.
+
+    Raises:
+        OSError: If the file cannot be written.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+class AudioCache:
+    """Content-addressed store of synthesized audio.
+
+    Entries are keyed on the text and every parameter that affects the
+    audio, and evicted least-recently-used first once the cache exceeds
+    max_bytes.
+    """
+
+    def __init__(self, *, directory: Path | None = None, max_bytes: int | None = None) -> None:
+        """Initialize audio cache.
+
+        Args:
+            directory: Cache directory. Defaults to the audio subdirectory of get_cache_dir().
+            max_bytes: Maximum total size of cached audio. None means unbounded.
+        """
+        self.directory = directory or get_cache_dir() / AUDIO_CACHE_SUBDIR
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def key(*, text: str, voice_id: str, audio_format: str) -> str:
+        """Compute the cache key for a synthesis request.
+
+        Args:
+            text: Text to synthesize.
+            voice_id: ID of the voice.
+            audio_format: Audio format.
+
+        Returns:
+            Hex digest identifying the audio.
+        """
+        digest = hashlib.blake2b(f"{voice_id}|{audio_format}|".encode(), digest_size=16)
+        digest.update(text.encode())
+        return digest.hexdigest()
+
+    def _path(self, key: str, audio_format: str) -> Path:
+        """Get the file path for a cache entry."""
+        return self.directory / f"{key}.{audio_format}"
+
+    def get(self, key: str, audio_format: str) -> bytes | None:
+        """Get cached audio and mark it as recently used.
+
+        Args:
+            key: Cache key from key().
+            audio_format: Audio format.
+
+        Returns:
+            Cached audio bytes, or None on a miss.
+        """
+        path = self._path(key, audio_format)
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+        except OSError:
+            return None
+        return data
+
+    def put(self, key: str, audio_format: str, data: bytes) -> None:
+        """Store audio, evicting old entries if the cache is over its limit.
+
+        Failures are logged and otherwise ignored, since the cache is only
+        an optimization.
+
+        Args:
+            key: Cache key from key().
+            audio_format: Audio format.
+            data: Audio bytes.
+        """
+        try:
+            atomic_write(self._path(key, audio_format), data)
+        except OSError as e:
+            _logger.warning("Could not cache audio: %s", e)
+            return
+
+        if self.max_bytes is not None:
+            self.evict()
+
+    def evict(self) -> None:
+        """Delete least-recently-used entries until the cache fits in max_bytes."""
+        entries = []
+        total = 0
+        for path in self.directory.iterdir():
+            if path.name.startswith("."):
+                continue
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
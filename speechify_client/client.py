@@ -1,12 +1,22 @@
 """Speechify REST client for text-to-speech synthesis API."""
 
+import hashlib
 import logging
 import os
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from pathlib import Path
 from typing import Any
 
 import requests
-from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+from speechify_client import __version__, _json
+from speechify_client.cache import AudioCache, atomic_write, get_cache_dir
 from speechify_client.exceptions import APIError, AuthenticationError, ValidationError
 from speechify_client.models import (
     AccessToken,
@@ -15,14 +25,25 @@ from speechify_client.models import (
     Voice,
 )
 
-# Load environment variables from .env file
-load_dotenv()
-
 _logger = logging.getLogger(__name__)
 
 SCRIPT_NAME = "speechify_client"
 API_BASE_URL = "https://api.sws.speechify.com/v1"
 DEFAULT_TIMEOUT = 30
+DEFAULT_VOICES_CACHE_TTL = 300
+DEFAULT_POOL_SIZE = 16
+DEFAULT_BATCH_WORKERS = 8
+DEFAULT_MAX_RETRIES = 3
+RETRY_BACKOFF_FACTOR = 0.3
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+STREAM_CHUNK_SIZE = 64 * 1024
+STREAM_MIME_TYPES = {"mp3": "audio/mpeg", "ogg": "audio/ogg", "aac": "audio/aac"}
+SPEECH_ENDPOINT = "/audio/speech"
+STREAM_ENDPOINT = "/audio/stream"
+VOICES_ENDPOINT = "/voices"
+TOKEN_ENDPOINT = "/auth/token"
+TOKEN_REFRESH_MARGIN = 60
+TOKEN_CACHE_FILENAME = "token.json"
 
 
 class SpeechifyClient:
@@ -37,16 +58,37 @@ class SpeechifyClient:
         *,
         api_key: str | None = None,
         timeout: int = DEFAULT_TIMEOUT,
+        voices_cache_ttl: int = DEFAULT_VOICES_CACHE_TTL,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        cache_access_token: bool = False,
+        cache_audio: bool = False,
+        max_audio_cache_bytes: int | None = None,
     ) -> None:
         """Initialize Speechify REST client.
 
         Args:
             api_key: Speechify API key. Defaults to SPEECHIFY_API_KEY env var.
             timeout: Request timeout in seconds.
+            voices_cache_ttl: Seconds to reuse the result of list_voices. Use 0 to disable caching.
+            pool_size: Maximum number of pooled HTTPS connections kept alive.
+            max_retries: Retries for connection errors and 429/5xx responses.
+            cache_access_token: Persist access tokens under the cache directory and
+                reuse a still-valid one across processes.
+            cache_audio: Store synthesized audio on disk, keyed on text, voice and format,
+                and serve repeated synthesize calls from it.
+            max_audio_cache_bytes: Size limit for the audio cache; least recently used
+                entries are evicted beyond it. None means unbounded.
 
         Raises:
             ValidationError: If API key is not provided or found.
         """
+        if api_key is None:
+            from dotenv import load_dotenv
+
+            # Load environment variables from .env file
+            load_dotenv()
+
         self.api_key = api_key or os.getenv("SPEECHIFY_API_KEY")
         if not self.api_key:
             raise ValidationError(
@@ -56,10 +98,44 @@ class SpeechifyClient:
 
         self.timeout = timeout
         self.base_url = API_BASE_URL
+        self.voices_cache_ttl = voices_cache_ttl
         self._access_token: str | None = None
-        self._session = requests.Session()
+        self._access_token_expires_at: float | None = None
+        self._token_lock = threading.Lock()
+        self._token_cache_path = get_cache_dir() / TOKEN_CACHE_FILENAME if cache_access_token else None
+        self._voices_cache: tuple[float, list[dict[str, Any]]] | None = None
+        self._audio_cache = AudioCache(max_bytes=max_audio_cache_bytes) if cache_audio else None
+        self._session = self._create_session(pool_size=pool_size, max_retries=max_retries)
+        self._session.headers.update(self._get_headers())
+        if self._token_cache_path is not None:
+            self._load_cached_access_token()
         _logger.debug("Initialized Speechify client")
 
+    @staticmethod
+    def _create_session(*, pool_size: int, max_retries: int) -> requests.Session:
+        """Create an HTTP session with a sized connection pool and retry policy.
+
+        Args:
+            pool_size: Maximum number of pooled connections.
+            max_retries: Total retries for failed requests.
+
+        Returns:
+            Configured requests session.
+        """
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=RETRY_BACKOFF_FACTOR,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=frozenset(["GET", "POST"]),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.headers["User-Agent"] = f"{SCRIPT_NAME}/{__version__}"
+        return session
+
     def _get_headers(self, *, use_access_token: bool = False) -> dict[str, str]:
         """Get request headers with authentication.
 
@@ -72,64 +148,103 @@ class SpeechifyClient:
         token = self._access_token if use_access_token and self._access_token else self.api_key
         return {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
 
-    def _make_request(
+    def _send(
         self,
         *,
         method: str,
         endpoint: str,
         json_data: dict[str, Any] | None = None,
-        use_access_token: bool = False,
-    ) -> dict[str, Any]:
-        """Make HTTP request to Speechify API.
+        headers: dict[str, str] | None = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        """Send HTTP request to Speechify API and check the response status.
 
         Args:
             method: HTTP method (GET, POST, etc.).
             endpoint: API endpoint path.
             json_data: JSON body for POST/PUT requests.
-            use_access_token: Use access token for authentication.
+            headers: Per-request headers overriding the session defaults.
+            stream: Defer downloading the response body.
 
         Returns:
-            Parsed JSON response.
+            Successful HTTP response.
 
         Raises:
             AuthenticationError: If authentication fails.
             APIError: If API request fails.
         """
-        url = f"{self.base_url}{endpoint}"
-        headers = self._get_headers(use_access_token=use_access_token)
+        if self._access_token_expires_at is not None and endpoint != TOKEN_ENDPOINT:
+            self.ensure_access_token()
+
+        url = self.base_url + endpoint
 
         try:
             response = self._session.request(
                 method,
                 url,
-                json=json_data,
+                data=_json.dumps(json_data) if json_data is not None else None,
                 headers=headers,
+                stream=stream,
                 timeout=self.timeout,
             )
-            _logger.debug(f"API request: {method} {endpoint} - {response.status_code}")
+        except requests.RequestException as e:
+            _logger.error("Request failed: %s", e)
+            raise APIError(message=f"Request failed: {str(e)}") from e
+
+        _logger.debug("API request: %s %s - %d", method, endpoint, response.status_code)
+
+        if response.status_code == 401:
+            response.close()
+            raise AuthenticationError(
+                message="Invalid API key or expired access token",
+                status_code=response.status_code,
+            )
+
+        if response.status_code >= 400:
+            try:
+                error_data = _json.loads(response.content)
+            except ValueError:
+                error_data = {"message": response.text}
+            finally:
+                response.close()
+
+            raise APIError(
+                message=error_data.get("message", f"API error: {response.status_code}"),
+                status_code=response.status_code,
+                response_data=error_data,
+            )
 
-            if response.status_code == 401:
-                raise AuthenticationError(
-                    message="Invalid API key or expired access token",
-                    status_code=response.status_code,
-                )
+        return response
 
-            if response.status_code >= 400:
-                try:
-                    error_data = response.json()
-                except ValueError:
-                    error_data = {"message": response.text}
+    def _make_request(
+        self,
+        *,
+        method: str,
+        endpoint: str,
+        json_data: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> dict[str, Any]:
+        """Make HTTP request to Speechify API.
 
-                raise APIError(
-                    message=error_data.get("message", f"API error: {response.status_code}"),
-                    status_code=response.status_code,
-                    response_data=error_data,
-                )
+        Args:
+            method: HTTP method (GET, POST, etc.).
+            endpoint: API endpoint path.
+            json_data: JSON body for POST/PUT requests.
+            headers: Per-request headers overriding the session defaults.
 
-            return response.json()
+        Returns:
+            Parsed JSON response.
 
-        except requests.RequestException as e:
-            _logger.error(f"Request failed: {e}")
+        Raises:
+            AuthenticationError: If authentication fails.
+            APIError: If API request fails.
+        """
+        response = self._send(method=method, endpoint=endpoint, json_data=json_data, headers=headers)
+
+        try:
+            return _json.loads(response.content)
+        except (requests.RequestException, ValueError) as e:
+            _logger.error("Request failed: %s", e)
             raise APIError(message=f"Request failed: {str(e)}") from e
 
     def synthesize(
@@ -139,6 +254,7 @@ class SpeechifyClient:
         voice_id: str,
         speed: float = 1.25,
         audio_format: str = "mp3",
+        cache: bool = True,
     ) -> SpeechSynthesisResponse:
         """Synthesize speech from text.
 
@@ -146,6 +262,7 @@ class SpeechifyClient:
             text: Text to synthesize to speech.
             voice_id: ID of the voice to use for synthesis.
             audio_format: Audio format (mp3, wav, etc.).
+            cache: Use the on-disk audio cache, if enabled on the client.
 
         Returns:
             Speech synthesis response with audio data.
@@ -154,11 +271,19 @@ class SpeechifyClient:
             ValidationError: If input parameters are invalid.
             APIError: If synthesis request fails.
         """
-        if not text or not text.strip():
+        if not text or text.isspace():
             raise ValidationError(message="Text input cannot be empty")
-        if not voice_id or not voice_id.strip():
+        if not voice_id or voice_id.isspace():
             raise ValidationError(message="Voice ID cannot be empty")
 
+        audio_cache = self._audio_cache if cache else None
+        if audio_cache is not None:
+            cache_key = audio_cache.key(text=text, voice_id=voice_id, audio_format=audio_format)
+            audio = audio_cache.get(cache_key, audio_format)
+            if audio is not None:
+                _logger.info("Loaded cached speech for voice: %s", voice_id)
+                return SpeechSynthesisResponse.from_audio_bytes(audio, format=audio_format)
+
         request_data = SpeechSynthesisRequest(
             input_text=text,
             voice_id=voice_id,
@@ -167,46 +292,240 @@ class SpeechifyClient:
 
         response_data = self._make_request(
             method="POST",
-            endpoint="/audio/speech",
+            endpoint=SPEECH_ENDPOINT,
+            json_data=request_data.to_dict(),
+        )
+
+        _logger.info("Synthesized speech for voice: %s", voice_id)
+        response = SpeechSynthesisResponse.from_dict(response_data)
+        if audio_cache is not None and response.audio_data:
+            try:
+                audio_cache.put(cache_key, audio_format, response.audio_bytes)
+            except ValueError:
+                _logger.warning("Not caching speech: audio data is not valid base64")
+        return response
+
+    def synthesize_stream(
+        self,
+        *,
+        text: str,
+        voice_id: str,
+        speed: float = 1.25,
+        audio_format: str = "mp3",
+    ) -> Iterator[bytes]:
+        """Synthesize speech and iterate over binary audio chunks as they arrive.
+
+        Uses the streaming endpoint, so audio can be consumed before the
+        full response is downloaded and is never base64-decoded in memory.
+        The request is sent immediately; chunks are read lazily.
+
+        Args:
+            text: Text to synthesize to speech.
+            voice_id: ID of the voice to use for synthesis.
+            speed: Speech speed.
+            audio_format: Audio format (mp3, ogg or aac).
+
+        Returns:
+            Iterator over audio chunks of up to 64 KiB.
+
+        Raises:
+            ValidationError: If input parameters are invalid.
+            APIError: If synthesis request fails.
+        """
+        if not text or text.isspace():
+            raise ValidationError(message="Text input cannot be empty")
+        if not voice_id or voice_id.isspace():
+            raise ValidationError(message="Voice ID cannot be empty")
+        if audio_format not in STREAM_MIME_TYPES:
+            raise ValidationError(
+                message=f"Unsupported streaming audio format: {audio_format}. "
+                f"Use one of: {', '.join(STREAM_MIME_TYPES)}"
+            )
+
+        request_data = SpeechSynthesisRequest(
+            input_text=text,
+            voice_id=voice_id,
+            audio_format=audio_format,
+        )
+
+        response = self._send(
+            method="POST",
+            endpoint=STREAM_ENDPOINT,
             json_data=request_data.to_dict(),
+            headers={"Accept": STREAM_MIME_TYPES[audio_format]},
+            stream=True,
         )
+        _logger.info("Streaming speech for voice: %s", voice_id)
+        return self._iter_audio(response)
+
+    @staticmethod
+    def _iter_audio(response: requests.Response) -> Iterator[bytes]:
+        """Yield audio chunks from a streamed response and close it when done.
 
-        _logger.info(f"Synthesized speech for voice: {voice_id}")
-        return SpeechSynthesisResponse.from_dict(response_data)
+        Args:
+            response: Streamed HTTP response.
+
+        Yields:
+            Audio chunks.
+
+        Raises:
+            APIError: If the connection fails mid-stream.
+        """
+        try:
+            yield from response.iter_content(chunk_size=STREAM_CHUNK_SIZE)
+        except requests.RequestException as e:
+            _logger.error("Request failed: %s", e)
+            raise APIError(message=f"Request failed: {str(e)}") from e
+        finally:
+            response.close()
+
+    def synthesize_to_file(
+        self,
+        *,
+        text: str,
+        voice_id: str,
+        out_path: Path,
+        speed: float = 1.25,
+        audio_format: str = "mp3",
+    ) -> Path:
+        """Synthesize speech and stream the binary audio straight to a file.
+
+        Audio is written in chunks as it arrives instead of being buffered
+        and base64-decoded in memory.
+
+        Args:
+            text: Text to synthesize to speech.
+            voice_id: ID of the voice to use for synthesis.
+            out_path: Destination file for the audio.
+            speed: Speech speed.
+            audio_format: Audio format (mp3, ogg or aac).
+
+        Returns:
+            Path of the written audio file.
+
+        Raises:
+            ValidationError: If input parameters are invalid.
+            APIError: If synthesis request fails.
+        """
+        out_path = Path(out_path)
+        part_path = out_path.with_name(f"{out_path.name}.part")
+        try:
+            # Open the file before sending the request so an unwritable path cannot leak the response
+            with open(part_path, "wb") as f:
+                chunks = self.synthesize_stream(text=text, voice_id=voice_id, speed=speed, audio_format=audio_format)
+                with closing(chunks):
+                    for chunk in chunks:
+                        f.write(chunk)
+            os.replace(part_path, out_path)
+        finally:
+            part_path.unlink(missing_ok=True)
+
+        _logger.info("Saved speech for voice %s to %s", voice_id, out_path)
+        return out_path
+
+    def synthesize_batch(
+        self,
+        *,
+        texts: list[str],
+        voice_id: str,
+        speed: float = 1.25,
+        audio_format: str = "mp3",
+        max_workers: int = DEFAULT_BATCH_WORKERS,
+    ) -> list[SpeechSynthesisResponse]:
+        """Synthesize several texts concurrently over the pooled session.
+
+        Keep max_workers at or below the client's pool_size so every worker
+        reuses a pooled connection.
+
+        Args:
+            texts: Texts to synthesize to speech.
+            voice_id: ID of the voice to use for synthesis.
+            speed: Speech speed passed to each synthesis call.
+            audio_format: Audio format (mp3, wav, etc.).
+            max_workers: Maximum number of concurrent requests.
+
+        Returns:
+            Speech synthesis responses in the same order as texts.
 
-    def list_voices(self) -> list[Voice]:
+        Raises:
+            ValidationError: If input parameters are invalid.
+            APIError: If any synthesis request fails.
+        """
+        if not texts:
+            return []
+        if not voice_id or voice_id.isspace():
+            raise ValidationError(message="Voice ID cannot be empty")
+
+        def _synthesize_one(text: str) -> SpeechSynthesisResponse:
+            return self.synthesize(text=text, voice_id=voice_id, speed=speed, audio_format=audio_format)
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(texts))) as executor:
+            return list(executor.map(_synthesize_one, texts))
+
+    def list_voices(self, *, limit: int | None = None, force_refresh: bool = False) -> list[Voice]:
         """Get list of available voices.
 
+        The API response is cached for ``voices_cache_ttl`` seconds.
+
+        Args:
+            limit: Maximum number of voices to return. Only this many Voice
+                objects are built.
+            force_refresh: Bypass the cache and fetch voices from the API.
+
         Returns:
             List of available voices.
 
+        Raises:
+            ValidationError: If limit is negative.
+            APIError: If request fails.
+        """
+        if limit is not None and limit < 0:
+            raise ValidationError(message="Limit cannot be negative")
+
+        voice_list = None
+        if not force_refresh and self._voices_cache is not None:
+            cached_at, cached_list = self._voices_cache
+            if time.monotonic() - cached_at < self.voices_cache_ttl:
+                _logger.debug("Using cached voice list")
+                voice_list = cached_list
+
+        if voice_list is None:
+            voice_list = self.list_voices_raw()
+            if self.voices_cache_ttl > 0:
+                self._voices_cache = (time.monotonic(), voice_list)
+            _logger.info("Retrieved %d available voices", len(voice_list))
+
+        if limit is not None:
+            voice_list = voice_list[:limit]
+
+        from_dict = Voice.from_dict
+        return [from_dict(voice_data) for voice_data in voice_list]
+
+    def list_voices_raw(self) -> list[dict[str, Any]]:
+        """Get available voices as the raw dictionaries returned by the API.
+
+        Useful for exporting the full voice catalog without converting it to
+        Voice objects. Results are not cached.
+
+        Returns:
+            List of voice dictionaries.
+
         Raises:
             APIError: If request fails.
         """
         response_data = self._make_request(
             method="GET",
-            endpoint="/voices",
+            endpoint=VOICES_ENDPOINT,
         )
 
-        voices = []
         # Handle both list and dict responses
         if isinstance(response_data, list):
-            voice_list = response_data
-        else:
-            voice_list = response_data.get("voices", [])
-
-        for voice_data in voice_list:
-            voices.append(
-                Voice(
-                    voice_id=voice_data.get("id", voice_data.get("voice_id", "")),
-                    name=voice_data.get("name", ""),
-                    gender=voice_data.get("gender"),
-                    language=voice_data.get("language"),
-                )
-            )
+            return response_data
+        return response_data.get("voices", [])
 
-        _logger.info(f"Retrieved {len(voices)} available voices")
-        return voices
+    def invalidate_voices_cache(self) -> None:
+        """Discard the cached voice list so the next list_voices call hits the API."""
+        self._voices_cache = None
 
     def get_voice(self, *, voice_id: str) -> Voice:
         """Get details for a specific voice.
@@ -221,25 +540,23 @@ class SpeechifyClient:
             ValidationError: If voice_id is invalid.
             APIError: If request fails.
         """
-        if not voice_id or not voice_id.strip():
+        if not voice_id or voice_id.isspace():
             raise ValidationError(message="Voice ID cannot be empty")
 
         response_data = self._make_request(
             method="GET",
-            endpoint=f"/voices/{voice_id}",
+            endpoint=f"{VOICES_ENDPOINT}/{voice_id}",
         )
 
-        _logger.info(f"Retrieved voice details: {voice_id}")
-        return Voice(
-            voice_id=response_data.get("id", response_data.get("voice_id")),
-            name=response_data.get("name", ""),
-            gender=response_data.get("gender"),
-            language=response_data.get("language"),
-        )
+        _logger.info("Retrieved voice details: %s", voice_id)
+        return Voice.from_dict(response_data)
 
     def create_access_token(self) -> AccessToken:
         """Create an access token from API key.
 
+        The token replaces the API key for authenticating subsequent requests
+        and is refreshed automatically shortly before it expires.
+
         Returns:
             Access token response.
 
@@ -248,14 +565,75 @@ class SpeechifyClient:
         """
         response_data = self._make_request(
             method="POST",
-            endpoint="/auth/token",
+            endpoint=TOKEN_ENDPOINT,
+            headers=self._get_headers(),
         )
 
         token = AccessToken.from_dict(response_data)
-        self._access_token = token.access_token
+        self._set_access_token(token.access_token, expires_at=time.time() + token.expires_in)
+        if self._token_cache_path is not None:
+            self._save_cached_access_token()
         _logger.info("Created access token")
         return token
 
+    def ensure_access_token(self) -> str:
+        """Get a valid access token, creating one if missing or about to expire.
+
+        Returns:
+            Current access token.
+
+        Raises:
+            APIError: If token creation fails.
+        """
+        with self._token_lock:
+            expires_at = self._access_token_expires_at
+            if self._access_token is None or expires_at is None or time.time() >= expires_at - TOKEN_REFRESH_MARGIN:
+                self.create_access_token()
+            return self._access_token
+
+    def _set_access_token(self, access_token: str, *, expires_at: float) -> None:
+        """Authenticate subsequent requests with an access token.
+
+        Args:
+            access_token: Access token to use.
+            expires_at: Expiry as a Unix timestamp.
+        """
+        self._access_token = access_token
+        self._access_token_expires_at = expires_at
+        self._session.headers.update(self._get_headers(use_access_token=True))
+
+    def _api_key_fingerprint(self) -> str:
+        """Get a stable, non-reversible identifier for the API key."""
+        return hashlib.sha256(self.api_key.encode()).hexdigest()[:16]
+
+    def _load_cached_access_token(self) -> None:
+        """Reuse a persisted access token if it belongs to this API key and is still valid."""
+        try:
+            data = _json.loads(self._token_cache_path.read_bytes())
+            access_token = data["access_token"]
+            expires_at = float(data["expires_at"])
+            fingerprint = data["api_key"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return
+
+        if fingerprint != self._api_key_fingerprint() or time.time() >= expires_at - TOKEN_REFRESH_MARGIN:
+            return
+
+        self._set_access_token(access_token, expires_at=expires_at)
+        _logger.debug("Loaded cached access token")
+
+    def _save_cached_access_token(self) -> None:
+        """Atomically persist the current access token, readable only by the owner."""
+        data = {
+            "access_token": self._access_token,
+            "expires_at": self._access_token_expires_at,
+            "api_key": self._api_key_fingerprint(),
+        }
+        try:
+            atomic_write(self._token_cache_path, _json.dumps(data))
+        except OSError as e:
+            _logger.warning("Could not cache access token: %s", e)
+
     def close(self) -> None:
         """Close the HTTP session."""
         self._session.close()
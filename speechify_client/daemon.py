@@ -0,0 +1,396 @@
+"""Long-lived synthesis daemon and thin ``speechify-tts`` CLI.
+
+The daemon keeps one SpeechifyClient (with its connection pool, voice cache
+and access token) alive behind a Unix socket, so short-lived invocations
+skip interpreter start-up, imports and the TLS handshake.
+
+Protocol: every message is a frame of a 4-byte big-endian length followed by
+the payload. The client sends one JSON request frame, e.g.
+``{"op": "synthesize", "text": ..., "voice_id": ..., "audio_format": ...}``. The
+daemon answers with a JSON header frame (``{"ok": true}`` or
+``{"ok": false, "error": ..., "type": ..., "status_code": ...}``) and, on
+success, audio chunk frames terminated by an empty frame.
+
+Usage:
+    echo "Hello" | speechify-tts | play -t mp3 -
+    speechify-tts --serve
+"""
+
+import argparse
+import logging
+import os
+import socket
+import socketserver
+import struct
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, BinaryIO
+
+from speechify_client import _json, exceptions
+from speechify_client.exceptions import APIError, SpeechifyError, ValidationError
+
+if TYPE_CHECKING:
+    from speechify_client.client import SpeechifyClient
+
+_logger = logging.getLogger(__name__)
+
+FRAME_HEADER = struct.Struct(">I")
+DEFAULT_IDLE_TIMEOUT = 600
+STARTUP_TIMEOUT = 5.0
+STARTUP_POLL_INTERVAL = 0.05
+
+
+def get_socket_path() -> Path:
+    """Get the default daemon socket path.
+
+    Returns:
+        $XDG_RUNTIME_DIR/speechify.sock, or a per-user socket in the temp directory.
+    """
+    runtime_dir = os.getenv("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / "speechify.sock"
+    return Path(tempfile.gettempdir()) / f"speechify-{os.getuid()}.sock"
+
+
+def _write_frame(stream: BinaryIO, payload: bytes) -> None:
+    """Write a length-prefixed frame."""
+    stream.write(FRAME_HEADER.pack(len(payload)))
+    stream.write(payload)
+
+
+def _read_frame(stream: BinaryIO) -> bytes:
+    """Read a length-prefixed frame.
+
+    Raises:
+        ConnectionError: If the peer closed the connection mid-frame.
+    """
+    header = stream.read(FRAME_HEADER.size)
+    if len(header) < FRAME_HEADER.size:
+        raise ConnectionError("Connection closed before frame header")
+    (length,) = FRAME_HEADER.unpack(header)
+    payload = stream.read(length)
+    if len(payload) < length:
+        raise ConnectionError("Connection closed mid-frame")
+    return payload
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Serve one request on a daemon connection."""
+
+    server: "SpeechifyDaemon"
+
+    def handle(self) -> None:
+        """Read a request frame and stream the response."""
+        self.server.touch()
+        try:
+            request = _json.loads(_read_frame(self.rfile))
+        except (ConnectionError, ValueError) as e:
+            _logger.warning("Invalid daemon request: %s", e)
+            return
+
+        if not isinstance(request, dict):
+            self._send_header({"ok": False, "type": "ValidationError", "error": "Request must be a JSON object"})
+            return
+
+        op = request.get("op")
+        if op == "ping":
+            self._send_header({"ok": True})
+            return
+        if op != "synthesize":
+            self._send_header({"ok": False, "type": "ValidationError", "error": f"Unknown op: {op}"})
+            return
+
+        try:
+            chunks = self.server.client.synthesize_stream(
+                text=request.get("text", ""),
+                voice_id=request.get("voice_id", ""),
+                audio_format=request.get("audio_format", "mp3"),
+            )
+        except SpeechifyError as e:
+            self._send_header(
+                {"ok": False, "type": type(e).__name__, "error": e.message, "status_code": e.status_code}
+            )
+            return
+
+        self._send_header({"ok": True})
+        try:
+            for chunk in chunks:
+                if chunk:
+                    _write_frame(self.wfile, chunk)
+            _write_frame(self.wfile, b"")
+        except SpeechifyError as e:
+            # Closing without the terminating frame tells the client the stream is incomplete
+            _logger.error("Synthesis failed mid-stream: %s", e.message)
+        except OSError as e:
+            _logger.debug("Client disconnected: %s", e)
+        finally:
+            self.server.touch()
+
+    def _send_header(self, header: dict[str, Any]) -> None:
+        """Send the JSON response header frame."""
+        _write_frame(self.wfile, _json.dumps(header))
+
+
+class SpeechifyDaemon(socketserver.ThreadingUnixStreamServer):
+    """Unix socket server sharing one SpeechifyClient across requests."""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        *,
+        socket_path: Path,
+        client: "SpeechifyClient",
+        idle_timeout: float | None = DEFAULT_IDLE_TIMEOUT,
+    ) -> None:
+        """Initialize and bind the daemon.
+
+        Args:
+            socket_path: Path of the Unix socket to listen on.
+            client: Client used to serve every request.
+            idle_timeout: Seconds without requests before serve_forever stops. None disables it.
+        """
+        self.socket_path = Path(socket_path)
+        self.client = client
+        self.idle_timeout = idle_timeout
+        self.last_activity = time.monotonic()
+
+        old_umask = os.umask(0o177)
+        try:
+            super().__init__(str(self.socket_path), _RequestHandler)
+        finally:
+            os.umask(old_umask)
+
+    def touch(self) -> None:
+        """Record request activity for the idle timeout."""
+        self.last_activity = time.monotonic()
+
+    def serve_forever(self, poll_interval: float = 0.5) -> None:
+        """Serve requests until shut down or idle for idle_timeout seconds."""
+        if self.idle_timeout is not None:
+            threading.Thread(target=self._watch_idle, daemon=True).start()
+        super().serve_forever(poll_interval)
+
+    def _watch_idle(self) -> None:
+        """Shut the server down once it has been idle for too long."""
+        while time.monotonic() - self.last_activity < self.idle_timeout:
+            time.sleep(min(self.idle_timeout, 1.0))
+        _logger.info("Idle for %ss, shutting down", self.idle_timeout)
+        self.shutdown()
+
+    def server_close(self) -> None:
+        """Close the socket and remove the socket file."""
+        super().server_close()
+        self.socket_path.unlink(missing_ok=True)
+
+
+def is_daemon_running(socket_path: Path) -> bool:
+    """Check whether a daemon answers on socket_path."""
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(STARTUP_TIMEOUT)
+            sock.connect(str(socket_path))
+            stream = sock.makefile("rwb")
+            _write_frame(stream, _json.dumps({"op": "ping"}))
+            stream.flush()
+            return _json.loads(_read_frame(stream)).get("ok", False)
+    except (OSError, ValueError):
+        return False
+
+
+def serve(*, socket_path: Path, idle_timeout: float | None = DEFAULT_IDLE_TIMEOUT) -> None:
+    """Run the daemon in the foreground.
+
+    Args:
+        socket_path: Path of the Unix socket to listen on.
+        idle_timeout: Seconds without requests before exiting. None disables it.
+    """
+    if socket_path.exists():
+        if is_daemon_running(socket_path):
+            _logger.info("Daemon already running on %s", socket_path)
+            return
+        socket_path.unlink()
+
+    from speechify_client.client import SpeechifyClient
+
+    with SpeechifyClient() as client:
+        server = SpeechifyDaemon(socket_path=socket_path, client=client, idle_timeout=idle_timeout)
+        _logger.info("Listening on %s", socket_path)
+        try:
+            server.serve_forever()
+        finally:
+            server.server_close()
+
+
+def ensure_daemon(socket_path: Path) -> None:
+    """Start a background daemon on socket_path unless one is already running.
+
+    Raises:
+        ConnectionError: If the daemon did not come up in time.
+    """
+    if is_daemon_running(socket_path):
+        return
+
+    subprocess.Popen(
+        [sys.executable, "-m", "speechify_client.daemon", "--serve", "--socket", str(socket_path)],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while time.monotonic() < deadline:
+        if is_daemon_running(socket_path):
+            return
+        time.sleep(STARTUP_POLL_INTERVAL)
+    raise ConnectionError(f"Speechify daemon did not start on {socket_path}")
+
+
+def synthesize_via_daemon(
+    *,
+    text: str,
+    voice_id: str,
+    audio_format: str = "mp3",
+    socket_path: Path | None = None,
+) -> Iterator[bytes]:
+    """Synthesize speech through a running daemon.
+
+    Args:
+        text: Text to synthesize to speech.
+        voice_id: ID of the voice to use for synthesis.
+        audio_format: Audio format (mp3, ogg or aac).
+        socket_path: Daemon socket. Defaults to get_socket_path().
+
+    Returns:
+        Iterator over audio chunks.
+
+    Raises:
+        OSError: If the daemon cannot be reached.
+        SpeechifyError: If the daemon reports a synthesis error.
+    """
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(socket_path or get_socket_path()))
+        stream = sock.makefile("rwb")
+        request = {
+            "op": "synthesize",
+            "text": text,
+            "voice_id": voice_id,
+            "audio_format": audio_format,
+        }
+        _write_frame(stream, _json.dumps(request))
+        stream.flush()
+        header = _json.loads(_read_frame(stream))
+    except BaseException:
+        sock.close()
+        raise
+
+    if not header.get("ok"):
+        sock.close()
+        error_class = getattr(exceptions, header.get("type", ""), APIError)
+        if not (isinstance(error_class, type) and issubclass(error_class, SpeechifyError)):
+            error_class = APIError
+        raise error_class(message=header.get("error", "Daemon error"), status_code=header.get("status_code"))
+
+    return _iter_audio_frames(sock, stream)
+
+
+def _iter_audio_frames(sock: socket.socket, stream: BinaryIO) -> Iterator[bytes]:
+    """Yield audio frames until the terminating empty frame.
+
+    Raises:
+        APIError: If the daemon closed the stream early.
+    """
+    try:
+        while chunk := _read_frame(stream):
+            yield chunk
+    except ConnectionError as e:
+        raise APIError(message=f"Daemon stream interrupted: {e}") from e
+    finally:
+        sock.close()
+
+
+def _require_api_key() -> None:
+    """Check an API key is configured without importing the HTTP client.
+
+    Loads .env like SpeechifyClient does, so a daemon spawned afterwards
+    inherits the key.
+
+    Raises:
+        ValidationError: If SPEECHIFY_API_KEY is not set.
+    """
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    if not os.getenv("SPEECHIFY_API_KEY"):
+        raise ValidationError(message="Speechify API key not provided. Set SPEECHIFY_API_KEY environment variable.")
+
+
+def _write_audio(chunks: Iterator[bytes]) -> None:
+    """Write audio chunks to stdout."""
+    output = sys.stdout.buffer
+    for chunk in chunks:
+        output.write(chunk)
+    output.flush()
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Entry point for the ``speechify-tts`` command."""
+    parser = argparse.ArgumentParser(
+        description="Synthesize stdin to audio on stdout via a persistent Speechify daemon"
+    )
+    parser.add_argument("--voice-id", default="george", help="Voice ID to use for synthesis (default: george)")
+    parser.add_argument("--format", dest="audio_format", default="mp3", help="Audio format (default: mp3)")
+    parser.add_argument("--socket", type=Path, default=None, help="Daemon socket path")
+    parser.add_argument("--no-daemon", action="store_true", help="Call the API directly from this process")
+    parser.add_argument("--serve", action="store_true", help="Run the daemon in the foreground")
+    parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=DEFAULT_IDLE_TIMEOUT,
+        help=f"Seconds of inactivity before the daemon exits (default: {DEFAULT_IDLE_TIMEOUT})",
+    )
+    args = parser.parse_args(argv)
+    socket_path = args.socket or get_socket_path()
+
+    try:
+        # Fail before a daemon is spawned that could not start without a key
+        _require_api_key()
+
+        if args.serve:
+            logging.basicConfig(level=logging.INFO)
+            serve(socket_path=socket_path, idle_timeout=args.idle_timeout or None)
+            return
+
+        text = sys.stdin.read()
+        request = {"text": text, "voice_id": args.voice_id, "audio_format": args.audio_format}
+
+        chunks = None
+        if not args.no_daemon:
+            try:
+                ensure_daemon(socket_path)
+                chunks = synthesize_via_daemon(socket_path=socket_path, **request)
+            except OSError as e:
+                _logger.warning("Daemon unavailable, calling the API directly: %s", e)
+
+        if chunks is not None:
+            _write_audio(chunks)
+            return
+
+        # Only the direct path pays for importing requests and building a session
+        from speechify_client.client import SpeechifyClient
+
+        with SpeechifyClient() as client:
+            _write_audio(client.synthesize_stream(**request))
+    except SpeechifyError as e:
+        print(f"Speechify error: {e.message}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
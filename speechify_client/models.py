@@ -1,10 +1,11 @@
 """Data models for Speechify API requests and responses."""
 
-from dataclasses import asdict, dataclass
+import binascii
+from dataclasses import dataclass, field
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class Voice:
     """Voice metadata from Speechify API."""
 
@@ -13,12 +14,28 @@ class Voice:
     gender: str | None = None
     language: str | None = None
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Voice":
+        """Create from API response dictionary."""
+        get = data.get
+        return cls(
+            voice_id=get("id") or get("voice_id", ""),
+            name=get("name", ""),
+            gender=get("gender"),
+            language=get("language"),
+        )
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary, excluding None values."""
-        return {k: v for k, v in asdict(self).items() if v is not None}
+        data: dict[str, Any] = {"voice_id": self.voice_id, "name": self.name}
+        if self.gender is not None:
+            data["gender"] = self.gender
+        if self.language is not None:
+            data["language"] = self.language
+        return data
 
 
-@dataclass
+@dataclass(slots=True)
 class SpeechSynthesisRequest:
     """Request parameters for speech synthesis."""
 
@@ -31,14 +48,21 @@ class SpeechSynthesisRequest:
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary, excluding None values."""
-        return {
-            k: v
-            for k, v in asdict(self).items()
-            if v is not None and k != "input_text"
-        } | {"input": self.input_text}
-
-
-@dataclass
+        data: dict[str, Any] = {
+            "input": self.input_text,
+            "voice_id": self.voice_id,
+            "audio_format": self.audio_format,
+        }
+        if self.sample_rate is not None:
+            data["sample_rate"] = self.sample_rate
+        if self.style is not None:
+            data["style"] = self.style
+        if self.emotion is not None:
+            data["emotion"] = self.emotion
+        return data
+
+
+@dataclass(slots=True)
 class SpeechSynthesisResponse:
     """Response from speech synthesis API."""
 
@@ -46,6 +70,21 @@ class SpeechSynthesisResponse:
     duration: float | None = None
     sample_rate: int | None = None
     format: str | None = None
+    _audio_bytes: bytes | None = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def audio_bytes(self) -> bytes:
+        """Decoded audio, computed from the base64 audio_data on first access."""
+        if self._audio_bytes is None:
+            self._audio_bytes = binascii.a2b_base64(self.audio_data)
+        return self._audio_bytes
+
+    @classmethod
+    def from_audio_bytes(cls, audio: bytes, *, format: str | None = None) -> "SpeechSynthesisResponse":
+        """Create from raw audio, e.g. loaded from the audio cache, without decoding it again."""
+        response = cls(audio_data=binascii.b2a_base64(audio, newline=False).decode("ascii"), format=format)
+        response._audio_bytes = audio
+        return response
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "SpeechSynthesisResponse":
@@ -58,7 +97,7 @@ class SpeechSynthesisResponse:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class AccessToken:
     """Access token response from authentication."""
 
@@ -0,0 +1,9 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def no_dotenv(monkeypatch):
+    """Keep a developer's .env file from supplying SPEECHIFY_API_KEY to the tests."""
+    monkeypatch.setattr("dotenv.load_dotenv", lambda *args, **kwargs: False)
@@ -0,0 +1,100 @@
+"""Fake requests session, response and client objects shared by the tests."""
+
+import json
+from collections.abc import Iterable
+from typing import Any
+
+
+class FakeResponse:
+    """Lightweight stand-in for a requests.Response."""
+
+    __slots__ = ("status_code", "content", "text", "chunks", "closed")
+
+    def __init__(
+        self,
+        status: int = 200,
+        payload: Any = None,
+        text: str = "",
+        chunks: list[bytes] | None = None,
+    ) -> None:
+        """Initialize fake response.
+
+        Args:
+            status: HTTP status code.
+            payload: JSON-serializable body. When None, text is used as the body.
+            text: Raw response text.
+            chunks: Chunks yielded by iter_content for streamed responses.
+        """
+        self.status_code = status
+        self.content = json.dumps(payload).encode() if payload is not None else text.encode()
+        self.text = text
+        self.chunks = chunks or []
+        self.closed = False
+
+    def iter_content(self, chunk_size: int | None = None) -> Any:
+        """Iterate over the configured chunks."""
+        return iter(self.chunks)
+
+    def close(self) -> None:
+        """Mark the response as closed."""
+        self.closed = True
+
+
+class FakeSession:
+    """Stand-in for requests.Session that records requests.
+
+    Every request returns ``next``; if ``next`` is an exception it is raised
+    instead.
+    """
+
+    def __init__(self) -> None:
+        """Initialize fake session."""
+        self.headers: dict[str, str] = {}
+        self.adapters: dict[str, Any] = {}
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget recorded requests and reply with an empty 200 response."""
+        self.calls: list[tuple[str, str, dict[str, Any]]] = []
+        self.next: FakeResponse | Exception = FakeResponse()
+        self.closed = False
+
+    @property
+    def last(self) -> tuple[str, str, dict[str, Any]]:
+        """Method, URL and keyword arguments of the most recent request."""
+        return self.calls[-1]
+
+    def mount(self, prefix: str, adapter: Any) -> None:
+        """Record the adapter mounted for prefix."""
+        self.adapters[prefix] = adapter
+
+    def request(self, method: str, url: str, **kwargs: Any) -> FakeResponse:
+        """Record the request and return the configured response."""
+        self.calls.append((method, url, kwargs))
+        if isinstance(self.next, Exception):
+            raise self.next
+        return self.next
+
+    def close(self) -> None:
+        """Mark the session as closed."""
+        self.closed = True
+
+
+class FakeClient:
+    """Stand-in for SpeechifyClient that records synthesize_stream calls.
+
+    Every call returns ``next`` as the audio chunks; if ``next`` is an
+    exception it is raised instead.
+    """
+
+    def __init__(self) -> None:
+        """Initialize fake client."""
+        self.calls: list[dict[str, Any]] = []
+        self.next: Iterable[bytes] | Exception = []
+
+    def synthesize_stream(self, **kwargs: Any) -> Iterable[bytes]:
+        """Record the call and return the configured chunks."""
+        self.calls.append(kwargs)
+        if isinstance(self.next, Exception):
+            raise self.next
+        return self.next
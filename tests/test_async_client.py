@@ -0,0 +1,143 @@
+"""Tests for asynchronous Speechify REST client."""
+
+import asyncio
+import json
+import time
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from speechify_client.async_client import AsyncSpeechifyClient  # noqa: E402
+from speechify_client.exceptions import APIError, AuthenticationError, ValidationError  # noqa: E402
+from speechify_client.models import SpeechSynthesisResponse  # noqa: E402
+
+
+def make_client(handler) -> AsyncSpeechifyClient:
+    """Create an async client whose requests are served by handler."""
+    return AsyncSpeechifyClient(api_key="test-api-key", transport=httpx.MockTransport(handler))
+
+
+def test_async_synthesize_success():
+    """Test successful asynchronous speech synthesis."""
+    requests_seen = []
+
+    def handler(request):
+        requests_seen.append(request)
+        return httpx.Response(200, json={"audioData": "base64encodedaudio==", "duration": 2.5})
+
+    async def run():
+        async with make_client(handler) as client:
+            return await client.synthesize(text="Hello world", voice_id="voice-123")
+
+    response = asyncio.run(run())
+
+    assert isinstance(response, SpeechSynthesisResponse)
+    assert response.audio_data == "base64encodedaudio=="
+    assert requests_seen[0].url.path == "/v1/audio/speech"
+    assert requests_seen[0].headers["Authorization"] == "Bearer test-api-key"
+    assert json.loads(requests_seen[0].content)["input"] == "Hello world"
+
+
+def test_async_synthesize_many_preserves_order():
+    """Test concurrent synthesis returns responses in input order."""
+
+    def handler(request):
+        return httpx.Response(200, json={"audioData": json.loads(request.content)["input"]})
+
+    async def run():
+        async with make_client(handler) as client:
+            return await client.asynthesize_many(texts=["one", "two", "three"], voice_id="voice-123")
+
+    responses = asyncio.run(run())
+
+    assert [r.audio_data for r in responses] == ["one", "two", "three"]
+
+
+def test_async_list_voices_cached():
+    """Test asynchronous voice listing parses and caches results."""
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(200, json={"voices": [{"id": "voice-1", "name": "Alex"}]})
+
+    async def run():
+        async with make_client(handler) as client:
+            first = await client.list_voices()
+            second = await client.list_voices()
+            return first, second
+
+    first, second = asyncio.run(run())
+
+    assert first == second
+    assert first[0].voice_id == "voice-1"
+    assert len(calls) == 1
+
+
+def test_async_create_access_token():
+    """Test access token replaces the API key for later requests."""
+    auth_headers = []
+
+    def handler(request):
+        auth_headers.append(request.headers["Authorization"])
+        if request.url.path == "/v1/auth/token":
+            return httpx.Response(200, json={"access_token": "new-token", "expires_in": 3600})
+        return httpx.Response(200, json=[])
+
+    async def run():
+        async with make_client(handler) as client:
+            token = await client.create_access_token()
+            await client.list_voices()
+            return token
+
+    token = asyncio.run(run())
+
+    assert token.access_token == "new-token"
+    assert auth_headers == ["Bearer test-api-key", "Bearer new-token"]
+
+
+def test_async_access_token_refreshed_near_expiry():
+    """Test an expiring access token is refreshed before the next request."""
+    tokens = iter(["first-token", "second-token"])
+    auth_headers = []
+
+    def handler(request):
+        if request.url.path == "/v1/auth/token":
+            return httpx.Response(200, json={"access_token": next(tokens), "expires_in": 3600})
+        auth_headers.append(request.headers["Authorization"])
+        return httpx.Response(200, json=[])
+
+    async def run():
+        async with make_client(handler) as client:
+            await client.create_access_token()
+            await client.list_voices_raw()
+            client._access_token_expires_at = time.time() + 10
+            await client.list_voices_raw()
+            return await client.ensure_access_token()
+
+    assert asyncio.run(run()) == "second-token"
+    assert auth_headers == ["Bearer first-token", "Bearer second-token"]
+
+
+def test_async_errors():
+    """Test error responses map to client exceptions."""
+
+    def handler(request):
+        if request.url.path == "/v1/voices":
+            return httpx.Response(401)
+        return httpx.Response(500, text="Internal Server Error")
+
+    async def run():
+        async with make_client(handler) as client:
+            with pytest.raises(AuthenticationError):
+                await client.list_voices()
+            with pytest.raises(APIError) as exc_info:
+                await client.get_voice(voice_id="voice-123")
+            assert exc_info.value.status_code == 500
+            with pytest.raises(ValidationError):
+                await client.synthesize(text="", voice_id="voice-123")
+            with pytest.raises(ValidationError, match="Limit cannot be negative"):
+                await client.list_voices(limit=-1)
+
+    asyncio.run(run())
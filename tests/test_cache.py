@@ -0,0 +1,52 @@
+"""Tests for Speechify on-disk caches."""
+
+import os
+
+from speechify_client.cache import AudioCache, atomic_write, get_cache_dir
+
+
+def test_get_cache_dir_from_env(tmp_path, monkeypatch):
+    """Test the cache directory can be overridden by environment variable."""
+    monkeypatch.setenv("SPEECHIFY_CACHE_DIR", str(tmp_path))
+    assert get_cache_dir() == tmp_path
+
+
+def test_atomic_write(tmp_path):
+    """Test atomic writes create parent directories and private files."""
+    path = tmp_path / "nested" / "file.bin"
+    atomic_write(path, b"data")
+    assert path.read_bytes() == b"data"
+    assert path.stat().st_mode & 0o777 == 0o600
+    assert os.listdir(path.parent) == ["file.bin"]
+
+
+def test_audio_cache_key():
+    """Test cache keys depend on the text, voice and format."""
+    params = {"text": "Hello", "voice_id": "v1", "audio_format": "mp3"}
+    key = AudioCache.key(**params)
+    assert key == AudioCache.key(**params)
+    assert len(key) == 32
+    for field, value in [("text", "Hi"), ("voice_id", "v2"), ("audio_format", "wav")]:
+        assert AudioCache.key(**{**params, field: value}) != key
+
+
+def test_audio_cache_get_put(tmp_path):
+    """Test audio round-trips through the cache."""
+    cache = AudioCache(directory=tmp_path)
+    assert cache.get("abc", "mp3") is None
+    cache.put("abc", "mp3", b"audio")
+    assert cache.get("abc", "mp3") == b"audio"
+    assert (tmp_path / "abc.mp3").exists()
+
+
+def test_audio_cache_evicts_least_recently_used(tmp_path):
+    """Test eviction removes the oldest entries beyond max_bytes."""
+    cache = AudioCache(directory=tmp_path, max_bytes=10)
+    cache.put("old", "mp3", b"12345")
+    os.utime(tmp_path / "old.mp3", (1, 1))
+    cache.put("new", "mp3", b"12345")
+    cache.put("newest", "mp3", b"12345")
+
+    assert cache.get("old", "mp3") is None
+    assert cache.get("new", "mp3") == b"12345"
+    assert cache.get("newest", "mp3") == b"12345"
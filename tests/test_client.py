@@ -1,9 +1,10 @@
 """Tests for Speechify REST client."""
 
-import os
-from unittest.mock import patch
+import json
+import time
 
 import pytest
+import requests
 
 from speechify_client import SpeechifyClient
 from speechify_client.exceptions import (
@@ -12,46 +13,126 @@ from speechify_client.exceptions import (
     ValidationError,
 )
 from speechify_client.models import AccessToken, SpeechSynthesisResponse
+from tests.fakes import FakeResponse, FakeSession
 
+VOICE_ID = "voice-123"
+AUDIO_DATA = "base64encodedaudio=="
 
-@pytest.fixture
+VOICES_LIST_RESPONSE = [
+    {
+        "id": "voice-1",
+        "name": "Alex",
+        "gender": "male",
+        "language": "en-US",
+    },
+    {
+        "id": "voice-2",
+        "name": "Victoria",
+        "gender": "female",
+        "language": "en-US",
+    },
+]
+VOICES_DICT_RESPONSE = {"voices": VOICES_LIST_RESPONSE}
+SYNTH_RESPONSE_CAMEL = {
+    "audioData": AUDIO_DATA,
+    "duration": 2.5,
+    "sampleRate": 44100,
+    "format": "mp3",
+}
+ACCESS_TOKEN_PAYLOAD = {
+    "access_token": "new-token",
+    "token_type": "bearer",
+    "expires_in": 3600,
+    "scope": "audio:speech",
+}
+
+
+@pytest.fixture(scope="session")
 def api_key():
     """Test API key."""
     return "test-api-key"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client(api_key):
-    """Create a Speechify client for testing."""
-    return SpeechifyClient(api_key=api_key)
+    """Create a Speechify client, backed by a FakeSession, shared by all tests."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(requests, "Session", FakeSession)
+        client = SpeechifyClient(api_key=api_key)
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="session")
+def default_headers(client):
+    """API-key headers of the shared client."""
+    return client._get_headers()
+
+
+@pytest.fixture(autouse=True)
+def reset_client(client):
+    """Reset the shared client's token and voice cache before each test."""
+    client._access_token = None
+    client._access_token_expires_at = None
+    client.invalidate_voices_cache()
+    client._session.headers.update(client._get_headers())
 
 
+@pytest.fixture(autouse=True)
+def session(client, monkeypatch):
+    """Get the shared client's FakeSession, cleared for this test.
+
+    Clients created during the test share it too, so no request reaches the
+    network and every request is recorded in one place.
+    """
+    session = client._session
+    session.reset()
+    monkeypatch.setattr(requests, "Session", lambda: session)
+    return session
+
+
+@pytest.fixture
+def fast_session(monkeypatch):
+    """Skip building the HTTPAdapter and its connection pools."""
+    monkeypatch.setattr("speechify_client.client.HTTPAdapter", lambda **kwargs: None)
+
+
+@pytest.mark.usefixtures("fast_session")
 def test_client_initialization_with_api_key(api_key):
     """Test client initialization with explicit API key."""
     client = SpeechifyClient(api_key=api_key)
     assert client.api_key == api_key
 
 
-def test_client_initialization_from_env():
+@pytest.mark.usefixtures("fast_session")
+def test_client_initialization_from_env(monkeypatch):
     """Test client initialization from environment variable."""
-    with patch.dict(os.environ, {"SPEECHIFY_API_KEY": "env-key"}):
-        client = SpeechifyClient()
-        assert client.api_key == "env-key"
+    monkeypatch.setenv("SPEECHIFY_API_KEY", "env-key")
+    client = SpeechifyClient()
+    assert client.api_key == "env-key"
 
 
-def test_client_initialization_missing_api_key():
+def test_client_initialization_missing_api_key(monkeypatch):
     """Test client initialization fails without API key."""
-    with patch.dict(os.environ, {}, clear=True):
-        with pytest.raises(ValidationError) as exc_info:
-            SpeechifyClient()
-        assert "API key not provided" in str(exc_info.value)
+    monkeypatch.delenv("SPEECHIFY_API_KEY", raising=False)
+    with pytest.raises(ValidationError, match="API key not provided"):
+        SpeechifyClient()
+
+
+def test_session_adapter_configuration(api_key):
+    """Test the session mounts a pooled adapter with a retry policy."""
+    client = SpeechifyClient(api_key=api_key, pool_size=4, max_retries=2)
+    adapter = client._session.adapters["https://"]
+    assert adapter._pool_maxsize == 4
+    assert adapter.max_retries.total == 2
+    assert 503 in adapter.max_retries.status_forcelist
+    assert client._session.headers["User-Agent"].startswith("speechify_client/")
 
 
-def test_get_headers_with_api_key(client, api_key):
+def test_get_headers_with_api_key(default_headers, api_key):
     """Test header generation with API key."""
-    headers = client._get_headers()
-    assert headers["Authorization"] == f"Bearer {api_key}"
-    assert headers["Content-Type"] == "application/json"
+    assert default_headers["Authorization"] == f"Bearer {api_key}"
+    assert default_headers["Content-Type"] == "application/json"
 
 
 def test_get_headers_with_access_token(client):
@@ -61,79 +142,134 @@ def test_get_headers_with_access_token(client):
     assert headers["Authorization"] == "Bearer access-token"
 
 
-@patch("speechify_client.client.requests.Session.request")
-def test_synthesize_success(mock_request, client):
+def test_session_default_headers(client, default_headers):
+    """Test authentication headers are set once on the session."""
+    assert client._session.headers.items() >= default_headers.items()
+
+
+def test_synthesize_success(session, client):
     """Test successful speech synthesis."""
-    mock_request.return_value.status_code = 200
-    mock_request.return_value.json.return_value = {
-        "audioData": "base64encodedaudio==",
-        "duration": 2.5,
-        "sampleRate": 44100,
-        "format": "mp3",
-    }
+    session.next = FakeResponse(payload=SYNTH_RESPONSE_CAMEL)
 
-    response = client.synthesize(text="Hello world", voice_id="voice-123")
+    response = client.synthesize(text="Hello world", voice_id=VOICE_ID)
 
     assert isinstance(response, SpeechSynthesisResponse)
-    assert response.audio_data == "base64encodedaudio=="
+    assert response.audio_data == AUDIO_DATA
     assert response.duration == 2.5
-    mock_request.assert_called_once()
+    assert len(session.calls) == 1
+    assert json.loads(session.last[2]["data"])["input"] == "Hello world"
+
+
+@pytest.mark.parametrize(
+    "method,kwargs,message",
+    [
+        ("synthesize", {"text": "", "voice_id": VOICE_ID}, "Text input cannot be empty"),
+        ("synthesize", {"text": " \n\t", "voice_id": VOICE_ID}, "Text input cannot be empty"),
+        ("synthesize", {"text": "Hello", "voice_id": ""}, "Voice ID cannot be empty"),
+        ("get_voice", {"voice_id": ""}, "Voice ID cannot be empty"),
+        ("list_voices", {"limit": -1}, "Limit cannot be negative"),
+    ],
+    ids=["empty-text", "whitespace-text", "empty-voice-id", "get-voice-empty-voice-id", "negative-limit"],
+)
+def test_validation_errors(client, method, kwargs, message):
+    """Test empty or whitespace-only input is rejected before any request."""
+    with pytest.raises(ValidationError, match=message):
+        getattr(client, method)(**kwargs)
+
+
+def test_synthesize_to_file(session, client, tmp_path):
+    """Test streamed synthesis writes audio chunks to disk."""
+    session.next = FakeResponse(chunks=[b"ID3", b"audio"])
+    out_path = tmp_path / "out.mp3"
+
+    result = client.synthesize_to_file(text="Hello world", voice_id=VOICE_ID, out_path=out_path)
+
+    assert result == out_path
+    assert out_path.read_bytes() == b"ID3audio"
+    assert list(tmp_path.iterdir()) == [out_path]
+    _, url, kwargs = session.last
+    assert url.endswith("/audio/stream")
+    assert kwargs["headers"] == {"Accept": "audio/mpeg"}
+    assert kwargs["stream"] is True
+    assert session.next.closed
+
+
+def test_synthesize_to_file_unwritable_path(session, client, tmp_path):
+    """Test no request is sent when the output file cannot be opened."""
+    with pytest.raises(FileNotFoundError):
+        client.synthesize_to_file(text="Hello world", voice_id=VOICE_ID, out_path=tmp_path / "missing" / "out.mp3")
+    assert session.calls == []
+
+
+def test_synthesize_stream(session, client):
+    """Test streamed synthesis yields chunks and closes the response."""
+    response = session.next = FakeResponse(chunks=[b"ID3", b"audio"])
+
+    chunks = client.synthesize_stream(text="Hello world", voice_id=VOICE_ID)
 
+    assert len(session.calls) == 1
+    assert not response.closed
+    assert list(chunks) == [b"ID3", b"audio"]
+    assert response.closed
 
-def test_synthesize_empty_text(client):
-    """Test synthesis with empty text."""
-    with pytest.raises(ValidationError) as exc_info:
-        client.synthesize(text="", voice_id="voice-123")
-    assert "cannot be empty" in str(exc_info.value)
 
+def test_synthesize_to_file_unsupported_format(client, tmp_path):
+    """Test streamed synthesis rejects formats without a streaming MIME type."""
+    with pytest.raises(ValidationError, match="Unsupported streaming audio format"):
+        client.synthesize_to_file(text="Hello", voice_id=VOICE_ID, out_path=tmp_path / "a.wav", audio_format="wav")
 
-def test_synthesize_empty_voice_id(client):
-    """Test synthesis with empty voice ID."""
-    with pytest.raises(ValidationError) as exc_info:
-        client.synthesize(text="Hello", voice_id="")
-    assert "Voice ID cannot be empty" in str(exc_info.value)
 
+def test_synthesize_audio_cache(session, api_key, tmp_path, monkeypatch):
+    """Test repeated synthesis is served from the on-disk audio cache."""
+    monkeypatch.setenv("SPEECHIFY_CACHE_DIR", str(tmp_path))
+    session.next = FakeResponse(payload={"audioData": "SUQzYXVkaW8=", "format": "mp3"})
+    client = SpeechifyClient(api_key=api_key, cache_audio=True)
 
-@patch("speechify_client.client.requests.Session.request")
-def test_synthesize_api_error(mock_request, client):
+    first = client.synthesize(text="Hello world", voice_id=VOICE_ID)
+    second = client.synthesize(text="Hello world", voice_id=VOICE_ID, speed=2.0)
+
+    assert len(session.calls) == 1
+    assert second.audio_bytes == first.audio_bytes == b"ID3audio"
+    assert second.audio_data == "SUQzYXVkaW8="
+
+    client.synthesize(text="Hello world", voice_id=VOICE_ID, cache=False)
+    client.synthesize(text="Hello world", voice_id="voice-456")
+    assert len(session.calls) == 3
+
+
+def test_synthesize_batch(session, client):
+    """Test batch synthesis returns one response per text in order."""
+    session.next = FakeResponse(payload=SYNTH_RESPONSE_CAMEL)
+
+    responses = client.synthesize_batch(texts=["One", "Two", "Three"], voice_id=VOICE_ID)
+
+    assert len(responses) == 3
+    assert all(r.audio_data == AUDIO_DATA for r in responses)
+    assert len(session.calls) == 3
+    assert client.synthesize_batch(texts=[], voice_id=VOICE_ID) == []
+
+
+def test_synthesize_api_error(session, client):
     """Test synthesis with API error response."""
-    mock_request.return_value.status_code = 400
-    mock_request.return_value.json.return_value = {"message": "Invalid voice ID"}
+    session.next = FakeResponse(400, {"message": "Invalid voice ID"})
 
     with pytest.raises(APIError) as exc_info:
         client.synthesize(text="Hello", voice_id="invalid")
     assert exc_info.value.status_code == 400
 
 
-@patch("speechify_client.client.requests.Session.request")
-def test_synthesize_authentication_error(mock_request, client):
+def test_synthesize_authentication_error(session, client):
     """Test synthesis with authentication error."""
-    mock_request.return_value.status_code = 401
+    session.next = FakeResponse(401)
 
     with pytest.raises(AuthenticationError):
-        client.synthesize(text="Hello", voice_id="voice-123")
-
-
-@patch("speechify_client.client.requests.Session.request")
-def test_list_voices_success(mock_request, client):
-    """Test successful voice listing with dict response."""
-    mock_request.return_value.status_code = 200
-    mock_request.return_value.json.return_value = {
-        "voices": [
-            {
-                "id": "voice-1",
-                "name": "Alex",
-                "gender": "male",
-                "language": "en-US",
-            },
-            {
-                "id": "voice-2",
-                "name": "Victoria",
-                "gender": "female",
-                "language": "en-US",
-            },
-        ]
-    }
+        client.synthesize(text="Hello", voice_id=VOICE_ID)
+
+
+@pytest.mark.parametrize("payload", [VOICES_DICT_RESPONSE, VOICES_LIST_RESPONSE], ids=["dict", "list"])
+def test_list_voices_success(session, client, payload):
+    """Test successful voice listing with dict or list response."""
+    session.next = FakeResponse(payload=payload)
 
     voices = client.list_voices()
 
@@ -143,109 +279,135 @@ def test_list_voices_success(mock_request, client):
     assert voices[1].voice_id == "voice-2"
 
 
-@patch("speechify_client.client.requests.Session.request")
-def test_list_voices_success_list_response(mock_request, client):
-    """Test successful voice listing with list response."""
-    mock_request.return_value.status_code = 200
-    mock_request.return_value.json.return_value = [
-        {
-            "id": "voice-1",
-            "name": "Alex",
-            "gender": "male",
-            "language": "en-US",
-        },
-        {
-            "id": "voice-2",
-            "name": "Victoria",
-            "gender": "female",
-            "language": "en-US",
-        },
-    ]
+def test_list_voices_limit(session, client):
+    """Test voice listing honors limit while caching the full catalog."""
+    session.next = FakeResponse(payload=[{"id": f"voice-{i}", "name": "Alex"} for i in range(5)])
 
-    voices = client.list_voices()
+    assert [v.voice_id for v in client.list_voices(limit=2)] == ["voice-0", "voice-1"]
+    assert len(client.list_voices()) == 5
+    assert len(session.calls) == 1
 
-    assert len(voices) == 2
-    assert voices[0].voice_id == "voice-1"
-    assert voices[0].name == "Alex"
-    assert voices[1].voice_id == "voice-2"
+
+def test_list_voices_raw(session, client):
+    """Test raw voice listing returns the API dictionaries unchanged."""
+    voice_data = {"id": "voice-1", "name": "Alex", "models": [{"name": "simba-english"}]}
+    session.next = FakeResponse(payload={"voices": [voice_data]})
+
+    assert client.list_voices_raw() == [voice_data]
 
 
-@patch("speechify_client.client.requests.Session.request")
-def test_get_voice_success(mock_request, client):
+def test_list_voices_cached(session, client):
+    """Test voice listing reuses cached results until refreshed."""
+    session.next = FakeResponse(payload=VOICES_LIST_RESPONSE)
+
+    first = client.list_voices()
+    second = client.list_voices()
+    assert first == second
+    assert len(session.calls) == 1
+
+    client.list_voices(force_refresh=True)
+    assert len(session.calls) == 2
+
+    client.invalidate_voices_cache()
+    client.list_voices()
+    assert len(session.calls) == 3
+
+
+def test_list_voices_cache_disabled(session, api_key):
+    """Test voice listing always hits the API when the cache TTL is zero."""
+    session.next = FakeResponse(payload=[])
+    client = SpeechifyClient(api_key=api_key, voices_cache_ttl=0)
+
+    client.list_voices()
+    client.list_voices()
+
+    assert len(session.calls) == 2
+
+
+def test_get_voice_success(session, client):
     """Test successful voice retrieval."""
-    mock_request.return_value.status_code = 200
-    mock_request.return_value.json.return_value = {
-        "id": "voice-123",
-        "name": "Alex",
-        "gender": "male",
-        "language": "en-US",
-    }
+    session.next = FakeResponse(
+        payload={
+            "id": VOICE_ID,
+            "name": "Alex",
+            "gender": "male",
+            "language": "en-US",
+        }
+    )
 
-    voice = client.get_voice(voice_id="voice-123")
+    voice = client.get_voice(voice_id=VOICE_ID)
 
-    assert voice.voice_id == "voice-123"
+    assert voice.voice_id == VOICE_ID
     assert voice.name == "Alex"
     assert voice.gender == "male"
 
 
-def test_get_voice_empty_voice_id(client):
-    """Test get_voice with empty voice ID."""
-    with pytest.raises(ValidationError) as exc_info:
-        client.get_voice(voice_id="")
-    assert "Voice ID cannot be empty" in str(exc_info.value)
-
-
-@patch("speechify_client.client.requests.Session.request")
-def test_create_access_token(mock_request, client):
+def test_create_access_token(session, client):
     """Test access token creation."""
-    mock_request.return_value.status_code = 200
-    mock_request.return_value.json.return_value = {
-        "access_token": "new-token",
-        "token_type": "bearer",
-        "expires_in": 3600,
-        "scope": "audio:speech",
-    }
+    session.next = FakeResponse(payload=ACCESS_TOKEN_PAYLOAD)
 
     token = client.create_access_token()
 
     assert isinstance(token, AccessToken)
     assert token.access_token == "new-token"
     assert client._access_token == "new-token"
+    assert client._session.headers["Authorization"] == "Bearer new-token"
+    assert session.last[2]["headers"]["Authorization"] == "Bearer test-api-key"
 
 
-@patch("speechify_client.client.requests.Session.close")
-def test_close_client(mock_close, client):
-    """Test closing the client."""
-    client.close()
-    mock_close.assert_called_once()
+def test_access_token_cached_on_disk(session, api_key, tmp_path, monkeypatch):
+    """Test access tokens are persisted and reused by later clients."""
+    monkeypatch.setenv("SPEECHIFY_CACHE_DIR", str(tmp_path))
+    session.next = FakeResponse(payload=ACCESS_TOKEN_PAYLOAD)
 
+    SpeechifyClient(api_key=api_key, cache_access_token=True).create_access_token()
+    assert "new-token" in (tmp_path / "token.json").read_text()
 
-def test_context_manager(api_key):
-    """Test client as context manager."""
-    with patch("speechify_client.client.requests.Session.close"):
-        with SpeechifyClient(api_key=api_key) as client:
-            assert client.api_key == api_key
+    client = SpeechifyClient(api_key=api_key, cache_access_token=True)
+    assert client._access_token == "new-token"
+    assert client._session.headers["Authorization"] == "Bearer new-token"
 
+    other = SpeechifyClient(api_key="other-key", cache_access_token=True)
+    assert other._access_token is None
+    assert len(session.calls) == 1
 
-@patch("speechify_client.client.requests.Session.request")
-def test_make_request_network_error(mock_request, client):
-    """Test request handling for network errors."""
-    import requests
 
-    mock_request.side_effect = requests.ConnectionError("Network error")
+def test_ensure_access_token_refreshes_near_expiry(session, client):
+    """Test expiring access tokens are refreshed before the next request."""
+    session.next = FakeResponse(payload={**ACCESS_TOKEN_PAYLOAD, "access_token": "fresh-token"})
+    client._set_access_token("stale-token", expires_at=time.time() + 10)
 
-    with pytest.raises(APIError) as exc_info:
-        client.list_voices()
-    assert "Request failed" in str(exc_info.value)
+    assert client.ensure_access_token() == "fresh-token"
+    assert client.ensure_access_token() == "fresh-token"
+    assert len(session.calls) == 1
+
+
+def test_close_client(client, session):
+    """Test closing the client."""
+    client.close()
+    assert session.closed
 
 
-@patch("speechify_client.client.requests.Session.request")
-def test_make_request_invalid_json(mock_request, client):
-    """Test request handling for invalid JSON response."""
-    mock_request.return_value.status_code = 500
-    mock_request.return_value.json.side_effect = ValueError("Invalid JSON")
-    mock_request.return_value.text = "Internal Server Error"
+@pytest.mark.usefixtures("fast_session")
+def test_context_manager(api_key, session):
+    """Test client as context manager."""
+    with SpeechifyClient(api_key=api_key) as client:
+        assert client.api_key == api_key
+    assert session.closed
+
+
+@pytest.mark.parametrize(
+    "response,message,status_code",
+    [
+        (requests.ConnectionError("Network error"), "Request failed", None),
+        (FakeResponse(500, text="Internal Server Error"), "Internal Server Error", 500),
+    ],
+    ids=["network-error", "invalid-json"],
+)
+def test_make_request_errors(session, client, response, message, status_code):
+    """Test network failures and non-JSON error bodies raise APIError."""
+    session.next = response
 
-    with pytest.raises(APIError) as exc_info:
+    with pytest.raises(APIError, match=message) as exc_info:
         client.list_voices()
-    assert exc_info.value.status_code == 500
+    assert exc_info.value.status_code == status_code
@@ -0,0 +1,119 @@
+"""Tests for the Speechify synthesis daemon."""
+
+import io
+import json
+import socket
+import subprocess
+import sys
+import threading
+
+import pytest
+
+from speechify_client.daemon import (
+    SpeechifyDaemon,
+    _read_frame,
+    _write_frame,
+    is_daemon_running,
+    main,
+    synthesize_via_daemon,
+)
+from speechify_client.exceptions import APIError, ValidationError
+from tests.fakes import FakeClient
+
+
+@pytest.fixture
+def daemon(tmp_path):
+    """Run a daemon backed by a FakeClient on a temporary socket."""
+    server = SpeechifyDaemon(socket_path=tmp_path / "speechify.sock", client=FakeClient(), idle_timeout=None)
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+def test_daemon_synthesize_streams_chunks(daemon):
+    """Test audio chunks are relayed from the shared client."""
+    daemon.client.next = iter([b"ID3", b"", b"frames"])
+
+    chunks = synthesize_via_daemon(text="Hello", voice_id="george", socket_path=daemon.socket_path)
+
+    assert list(chunks) == [b"ID3", b"frames"]
+    assert daemon.client.calls == [{"text": "Hello", "voice_id": "george", "audio_format": "mp3"}]
+
+
+def test_daemon_synthesize_error(daemon):
+    """Test client errors are re-raised on the caller side."""
+    daemon.client.next = ValidationError(message="Text input cannot be empty")
+
+    with pytest.raises(ValidationError, match="Text input cannot be empty"):
+        synthesize_via_daemon(text="", voice_id="george", socket_path=daemon.socket_path)
+
+
+def test_daemon_synthesize_interrupted(daemon):
+    """Test a stream that fails mid-way raises APIError instead of truncating silently."""
+
+    def chunks():
+        yield b"ID3"
+        raise APIError(message="Stream interrupted")
+
+    daemon.client.next = chunks()
+
+    stream = synthesize_via_daemon(text="Hello", voice_id="george", socket_path=daemon.socket_path)
+
+    assert next(stream) == b"ID3"
+    with pytest.raises(APIError):
+        next(stream)
+
+
+@pytest.mark.parametrize("payload", [b"[]", b'"x"'], ids=["array", "string"])
+def test_daemon_rejects_non_object_request(daemon, payload):
+    """Test a request frame that is not a JSON object gets an error header."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(str(daemon.socket_path))
+        stream = sock.makefile("rwb")
+        _write_frame(stream, payload)
+        stream.flush()
+        header = json.loads(_read_frame(stream))
+
+    assert header == {"ok": False, "type": "ValidationError", "error": "Request must be a JSON object"}
+
+
+def test_is_daemon_running(daemon, tmp_path):
+    """Test the liveness check."""
+    assert is_daemon_running(daemon.socket_path)
+    assert not is_daemon_running(tmp_path / "missing.sock")
+
+
+def fail_ensure_daemon(socket_path):
+    """Stand-in for ensure_daemon() that fails instead of spawning a daemon."""
+    raise AssertionError("spawned")
+
+
+def fail_serve(**kwargs):
+    """Stand-in for serve() that fails instead of blocking in a real server."""
+    raise AssertionError("served")
+
+
+@pytest.mark.parametrize("argv", [[], ["--serve"]], ids=["synthesize", "serve"])
+def test_main_without_api_key(argv, tmp_path, monkeypatch, capsys):
+    """Test a missing API key exits with an error instead of spawning or starting a daemon."""
+    monkeypatch.delenv("SPEECHIFY_API_KEY", raising=False)
+    monkeypatch.setattr("sys.stdin", io.StringIO("Hello"))
+    monkeypatch.setattr("speechify_client.daemon.ensure_daemon", fail_ensure_daemon)
+    monkeypatch.setattr("speechify_client.daemon.serve", fail_serve)
+
+    with pytest.raises(SystemExit) as exc_info:
+        main([*argv, "--socket", str(tmp_path / "speechify.sock")])
+
+    assert exc_info.value.code == 1
+    assert "API key not provided" in capsys.readouterr().err
+    assert not (tmp_path / "speechify.sock").exists()
+
+
+def test_daemon_import_without_client():
+    """Test the CLI module does not load the HTTP client or requests."""
+    code = "import sys, speechify_client.daemon; print('requests' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "False"
@@ -1,5 +1,10 @@
 """Tests for Speechify data models."""
 
+import subprocess
+import sys
+
+import pytest
+
 from speechify_client.models import (
     AccessToken,
     SpeechSynthesisRequest,
@@ -7,20 +12,62 @@ from speechify_client.models import (
     Voice,
 )
 
+VOICE_ID = "v1"
+AUDIO_DATA = "base64=="
+
+SYNTH_RESPONSE_CAMEL = {
+    "audioData": AUDIO_DATA,
+    "duration": 2.5,
+    "sampleRate": 44100,
+    "format": "mp3",
+}
+SYNTH_RESPONSE_SNAKE = {
+    "audio_data": AUDIO_DATA,
+    "duration": 2.5,
+    "sample_rate": 44100,
+    "format": "mp3",
+}
+ACCESS_TOKEN_PAYLOAD = {
+    "access_token": "abc.def.xyz",
+    "token_type": "bearer",
+    "expires_in": 3600,
+    "scope": "audio:speech",
+}
+
+
+@pytest.fixture(scope="module")
+def alex():
+    """Voice shared by tests that only read it."""
+    return Voice(voice_id=VOICE_ID, name="Alex", gender="male")
 
-def test_voice_creation():
+
+def test_voice_creation(alex):
     """Test Voice model creation."""
-    voice = Voice(voice_id="v1", name="Alex", gender="male")
-    assert voice.voice_id == "v1"
-    assert voice.name == "Alex"
-    assert voice.gender == "male"
+    assert alex.voice_id == VOICE_ID
+    assert alex.name == "Alex"
+    assert alex.gender == "male"
+    assert alex.language is None
+
+
+def test_models_use_slots(alex):
+    """Test models are slotted and carry no per-instance __dict__."""
+    assert not hasattr(alex, "__dict__")
+    assert not hasattr(SpeechSynthesisResponse(audio_data=AUDIO_DATA), "__dict__")
+
 
+def test_voice_from_dict(alex):
+    """Test Voice from_dict with either id key."""
+    assert Voice.from_dict({"id": VOICE_ID, "name": "Alex", "gender": "male"}) == alex
+    voice = Voice.from_dict({"voice_id": "v2", "name": "Victoria", "gender": "female"})
+    assert voice.voice_id == "v2"
+    assert voice.gender == "female"
+    assert voice.language is None
 
-def test_voice_to_dict():
+
+def test_voice_to_dict(alex):
     """Test Voice to_dict method."""
-    voice = Voice(voice_id="v1", name="Alex", gender="male", language=None)
-    voice_dict = voice.to_dict()
-    assert voice_dict["voice_id"] == "v1"
+    voice_dict = alex.to_dict()
+    assert voice_dict["voice_id"] == VOICE_ID
     assert voice_dict["name"] == "Alex"
     assert "language" not in voice_dict
 
@@ -29,63 +76,61 @@ def test_speech_synthesis_request_to_dict():
     """Test SpeechSynthesisRequest to_dict method."""
     request = SpeechSynthesisRequest(
         input_text="Hello world",
-        voice_id="v1",
+        voice_id=VOICE_ID,
         audio_format="mp3",
         emotion=None,
     )
     request_dict = request.to_dict()
     assert request_dict["input"] == "Hello world"
-    assert request_dict["voice_id"] == "v1"
+    assert request_dict["voice_id"] == VOICE_ID
     assert request_dict["audio_format"] == "mp3"
     assert "emotion" not in request_dict
 
 
-def test_speech_synthesis_response_from_dict_camel_case():
-    """Test SpeechSynthesisResponse from_dict with camelCase keys."""
-    data = {
-        "audioData": "base64==",
-        "duration": 2.5,
-        "sampleRate": 44100,
-        "format": "mp3",
-    }
+@pytest.mark.parametrize("data", [SYNTH_RESPONSE_CAMEL, SYNTH_RESPONSE_SNAKE], ids=["camel-case", "snake-case"])
+def test_speech_synthesis_response_from_dict(data):
+    """Test SpeechSynthesisResponse from_dict with camelCase or snake_case keys."""
     response = SpeechSynthesisResponse.from_dict(data)
-    assert response.audio_data == "base64=="
+    assert response.audio_data == AUDIO_DATA
     assert response.duration == 2.5
     assert response.sample_rate == 44100
 
 
-def test_speech_synthesis_response_from_dict_snake_case():
-    """Test SpeechSynthesisResponse from_dict with snake_case keys."""
-    data = {
-        "audio_data": "base64==",
-        "duration": 2.5,
-        "sample_rate": 44100,
-        "format": "mp3",
-    }
-    response = SpeechSynthesisResponse.from_dict(data)
-    assert response.audio_data == "base64=="
-    assert response.duration == 2.5
+def test_speech_synthesis_response_audio_bytes():
+    """Test audio_bytes decodes base64 audio once and caches it."""
+    response = SpeechSynthesisResponse(audio_data="SUQzYXVkaW8=")
+    assert response.audio_bytes == b"ID3audio"
+    assert response.audio_bytes is response.audio_bytes
+    assert response == SpeechSynthesisResponse(audio_data="SUQzYXVkaW8=")
+
+
+def test_speech_synthesis_response_from_audio_bytes():
+    """Test from_audio_bytes encodes audio_data and keeps the raw bytes."""
+    response = SpeechSynthesisResponse.from_audio_bytes(b"ID3audio", format="mp3")
+    assert response.audio_data == "SUQzYXVkaW8="
+    assert response.format == "mp3"
+    assert response.audio_bytes == b"ID3audio"
+    assert response == SpeechSynthesisResponse(audio_data="SUQzYXVkaW8=", format="mp3")
+
+
+@pytest.mark.parametrize(
+    "data,expected",
+    [
+        (
+            ACCESS_TOKEN_PAYLOAD,
+            AccessToken(access_token="abc.def.xyz", token_type="bearer", expires_in=3600, scope="audio:speech"),
+        ),
+        ({"access_token": "token"}, AccessToken(access_token="token", token_type="bearer", expires_in=3600)),
+    ],
+    ids=["full", "minimal"],
+)
+def test_access_token_from_dict(data, expected):
+    """Test AccessToken from_dict with full or minimal data."""
+    assert AccessToken.from_dict(data) == expected
 
 
-def test_access_token_from_dict():
-    """Test AccessToken from_dict method."""
-    data = {
-        "access_token": "abc.def.xyz",
-        "token_type": "bearer",
-        "expires_in": 3600,
-        "scope": "audio:speech",
-    }
-    token = AccessToken.from_dict(data)
-    assert token.access_token == "abc.def.xyz"
-    assert token.token_type == "bearer"
-    assert token.expires_in == 3600
-    assert token.scope == "audio:speech"
-
-
-def test_access_token_from_dict_minimal():
-    """Test AccessToken from_dict with minimal data."""
-    data = {"access_token": "token"}
-    token = AccessToken.from_dict(data)
-    assert token.access_token == "token"
-    assert token.token_type == "bearer"
-    assert token.expires_in == 3600
+def test_models_import_without_client():
+    """Test importing models does not load the HTTP client or requests."""
+    code = "import sys, speechify_client.models; print('requests' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "False"